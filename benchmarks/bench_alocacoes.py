@@ -0,0 +1,77 @@
+"""Memória alocada por chamada de gerar_payload, medida com tracemalloc.
+
+Compara a implementação original (dict ``self.payload`` reconstruído a
+cada chamada), o GeradorPix atual (tupla imutável ``CamposPayload``) e o
+``PayloadTemplate.render``. Para cada um mostra o pico de memória
+temporária de uma chamada, o estado que fica guardado na instância entre
+as chamadas, os blocos que continuam vivos depois dela (o payload
+devolvido) e o tempo por chamada.
+
+Uso: python benchmarks/bench_alocacoes.py [n]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estresse_threads import GeradorOriginal
+from gerador import GeradorPix
+from suite import gerar_dados
+from template import PayloadTemplate
+
+
+def estado_retido(classe, linha):
+    """Bytes que uma instância nova de ``classe`` mantém depois de gerar um payload"""
+    tracemalloc.start()
+    gerador = classe()
+    antes = tracemalloc.get_traced_memory()[0]
+    gerador.gerar_payload(*linha)
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return depois - antes
+
+
+def medir(funcao, linhas):
+    """Retorna (pico médio em bytes, blocos retidos por chamada, microssegundos por chamada)"""
+    for linha in linhas[:10]:
+        funcao(linha)  # aquecimento (caches de formatação, lru_cache...)
+
+    tracemalloc.start()
+    picos = 0
+    for linha in linhas:
+        antes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        funcao(linha)
+        picos += tracemalloc.get_traced_memory()[1] - antes
+    inicio = tracemalloc.take_snapshot()
+    resultados = [funcao(linha) for linha in linhas]
+    retidos = sum(stat.count_diff for stat in tracemalloc.take_snapshot().compare_to(inicio, "filename"))
+    tracemalloc.stop()
+    del resultados
+
+    tempo = min(timeit.repeat(lambda: [funcao(linha) for linha in linhas], number=1, repeat=5))
+    n = len(linhas)
+    return picos / n, retidos / n, tempo / n * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    linhas = gerar_dados(n)
+    templates = {(c, nome, ci): PayloadTemplate(c, nome, ci) for c, _, _, nome, ci in linhas}
+    original, atual = GeradorOriginal(), GeradorPix()
+    casos = [
+        ("original (self.payload)", GeradorOriginal, lambda linha: original.gerar_payload(*linha)),
+        ("GeradorPix (CamposPayload)", GeradorPix, lambda linha: atual.gerar_payload(*linha)),
+        ("PayloadTemplate.render", None, lambda l: templates[(l[0], l[3], l[4])].render(l[1], l[2])),
+    ]
+    print(f"{'implementação':28} {'pico B/chamada':>15} {'estado B':>9} {'blocos retidos':>15} {'us/chamada':>11}")
+    for nome, classe, funcao in casos:
+        pico, retidos, tempo = medir(funcao, linhas)
+        estado = estado_retido(classe, linhas[0]) if classe else 0
+        print(f"{nome:28} {pico:15,.0f} {estado:9,} {retidos:15.2f} {tempo:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
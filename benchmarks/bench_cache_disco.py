@@ -0,0 +1,64 @@
+"""Mede o início a frio e a quente de um processo que serve QR codes.
+
+Cada cenário roda em um processo novo e gera os PNGs de ``quantidade``
+payloads: sem cache, com o cache em disco vazio e com o cache já preenchido
+pela execução anterior. São reportados o tempo de parede (importações
+incluídas) e se o qrcode chegou a ser importado.
+
+Uso: python benchmarks/bench_cache_disco.py [quantidade]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVIR = """
+import sys, time
+_t = time.perf_counter()
+{preparo}
+for i in range({quantidade}):
+    payload = {payload}
+    {imagem}
+print(time.perf_counter() - _t, "qrcode" in sys.modules)
+"""
+
+SEM_CACHE = {
+    "preparo": "from gerador import GeradorPix; from qr import gerar_qrcode_bytes; g = GeradorPix()",
+    "payload": "g.gerar_payload('fortes.barman@gmail.com', i + 1, f'TX{{i}}')",
+    "imagem": "gerar_qrcode_bytes(payload, 'PNG', 300)",
+}
+
+COM_CACHE = {
+    "preparo": "from cache_disco import abrir; c = abrir({caminho!r})",
+    "payload": "c.payload('fortes.barman@gmail.com', i + 1, f'TX{{i}}')",
+    "imagem": "c.imagem(payload, 300, 'PNG')",
+}
+
+
+def medir(partes, quantidade, **formatos):
+    """Executa o cenário em um processo novo e retorna (segundos, qrcode importado)"""
+    partes = {nome: codigo.format(**formatos) for nome, codigo in partes.items()}
+    saida = subprocess.run([sys.executable, "-c", SERVIR.format(quantidade=quantidade, **partes)],
+                           cwd=RAIZ, capture_output=True, text=True, check=True).stdout.split()
+    return float(saida[0]), saida[1] == "True"
+
+
+def main():
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "cache.db")
+        cenarios = [
+            ("sem cache", medir(SEM_CACHE, quantidade)),
+            ("cache em disco vazio", medir(COM_CACHE, quantidade, caminho=caminho)),
+            ("cache em disco preenchido", medir(COM_CACHE, quantidade, caminho=caminho)),
+        ]
+    print(f"{quantidade} payloads + PNG por processo")
+    print(f"{'cenário':28} {'segundos':>9} {'qrcode importado':>17}")
+    for nome, (segundos, importado) in cenarios:
+        print(f"{nome:28} {segundos:9.3f} {'sim' if importado else 'não':>17}")
+
+
+if __name__ == "__main__":
+    main()
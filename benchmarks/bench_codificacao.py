@@ -0,0 +1,62 @@
+"""Compara o tamanho do símbolo e o tempo de codificação do QR code por tamanho de payload.
+
+Para payloads com chaves, txids e nomes de tamanhos variados, mostra a
+versão (lado em módulos) escolhida pelo caminho padrão (``qr.gerar_matriz``,
+busca do qrcode a partir da versão 1) e pela codificação adaptativa
+(``codificacao_qr``), com o payload original e com ``payload_alfanumerico``,
+e o tempo para montar a matriz em cada caminho, inclusive com a máscara
+fixa. A correção é M em todos os casos.
+
+Uso: python benchmarks/bench_codificacao.py [repeticoes]
+"""
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qr
+from codificacao_qr import PoliticaQR, gerar_matriz, payload_alfanumerico, prever
+from gerador import GeradorPix
+
+CHAVES = ("52998224725", "fortes.barman@gmail.com", "123e4567-e89b-12d3-a456-426614174000")
+MASCARA_FIXA = PoliticaQR(mascara=0)
+
+
+def payloads():
+    """Payloads de teste, com semente fixa, em ordem de tamanho"""
+    aleatorio = random.Random(42)
+    gerador = GeradorPix()
+    resultado = []
+    for chave in CHAVES:
+        for tamanho in (5, 15, 25):
+            txid = "".join(aleatorio.choices(string.ascii_letters + string.digits, k=tamanho))
+            nome = ("Loja " + "".join(aleatorio.choices(string.ascii_lowercase, k=25)))[:tamanho]
+            resultado.append(gerador.gerar_payload(chave, 10 + tamanho, txid, nome, "Sao Paulo"))
+    return sorted(resultado, key=len)
+
+
+def medir(funcao, repeticoes):
+    return min(timeit.repeat(funcao, number=repeticoes, repeat=3)) / repeticoes * 1000
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print("versão (lado em módulos) e ms por matriz; 'maiúsc.' usa payload_alfanumerico")
+    print(f"{'bytes':>5} {'padrão':>10} {'adaptativa':>11} {'maiúsc.':>10} "
+          f"{'ms padrão':>10} {'ms adapt.':>10} {'ms máscara 0':>13}")
+    for payload in payloads():
+        padrao = len(qr.gerar_matriz(payload)) - 8
+        adaptativa = prever(payload).versao
+        maiusculas = prever(payload_alfanumerico(payload)).versao
+        t_padrao = medir(lambda: qr.gerar_matriz(payload), repeticoes)
+        t_adaptativa = medir(lambda: gerar_matriz(payload), repeticoes)
+        t_mascara = medir(lambda: gerar_matriz(payload, MASCARA_FIXA), repeticoes)
+        print(f"{len(payload):5} {(padrao - 17) // 4:>4} ({padrao:3}) {adaptativa:>5} ({17 + 4 * adaptativa:3}) "
+              f"{maiusculas:>4} ({17 + 4 * maiusculas:3}) {t_padrao:10.2f} {t_adaptativa:10.2f} {t_mascara:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compara tamanho de arquivo e tempo de codificação do QR code por formato.
+
+A referência é o PNG da implementação original (box_size=10 + resize
+LANCZOS para 500 px, salvo pelo Pillow); os demais saem direto da matriz de
+módulos por ``qr.exportar_matriz``. A matriz é calculada uma vez, então só
+a codificação do arquivo é medida.
+
+Uso: python benchmarks/bench_exportar.py [repeticoes]
+"""
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_qr import PAYLOAD, codificar, desenho_antigo
+
+import qr
+
+TAMANHO = 500
+
+
+def png_antigo(codigo):
+    buffer = io.BytesIO()
+    desenho_antigo(codigo, TAMANHO).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    codigo = codificar(PAYLOAD)
+    matriz = qr.gerar_matriz(PAYLOAD)
+
+    casos = [("PNG original (LANCZOS)", lambda: png_antigo(codigo))]
+    for formato in ("PNG", "SVG", "PDF", "GIF", "JPEG"):
+        casos.append((f"{formato} da matriz", lambda formato=formato: qr.exportar_matriz(matriz, formato, TAMANHO)))
+
+    print(f"{'formato':24} {'bytes':>8} {'ms/arquivo':>11}")
+    for nome, funcao in casos:
+        tamanho = len(funcao())
+        tempo = min(timeit.repeat(funcao, number=repeticoes, repeat=3)) / repeticoes
+        print(f"{nome:24} {tamanho:8,} {tempo * 1000:11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Mede o custo de inicialização de um processo que só gera payloads.
+
+Compara importar apenas o núcleo (gerador) com importar também a interface
+gráfica e a renderização de QR code, como fazia o main.py antes da separação.
+Cada cenário roda em um processo novo; são reportados o tempo de parede e o
+pico de memória (RSS).
+
+Uso: python benchmarks/bench_import.py [repeticoes]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GERAR = "GeradorPix().gerar_payload('fortes.barman@gmail.com', 10, 'testepix')"
+CENARIOS = {
+    "núcleo (gerador)": f"from gerador import GeradorPix; {GERAR}",
+    "main.py": f"from main import GeradorPix; {GERAR}",
+    "eager (PyQt6 + qrcode + PIL)": f"import interface, qr; from gerador import GeradorPix; {GERAR}",
+}
+
+MEDIR = """
+import resource, time
+_t = time.perf_counter()
+{codigo}
+print(time.perf_counter() - _t, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def medir(codigo, repeticoes):
+    """Executa ``codigo`` em processos novos e retorna (mediana em s, RSS em KiB)"""
+    tempos, memorias = [], []
+    ambiente = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", MEDIR.format(codigo=codigo)],
+            cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        tempos.append(float(saida[0]))
+        memorias.append(int(saida[1]))
+    return statistics.median(tempos), max(memorias)
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'cenário':32} {'import+payload':>15} {'pico RSS':>12}")
+    for nome, codigo in CENARIOS.items():
+        try:
+            tempo, memoria = medir(codigo, repeticoes)
+        except subprocess.CalledProcessError as e:
+            print(f"{nome:32} falhou: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{nome:32} {tempo * 1000:12.1f} ms {memoria / 1024:9.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
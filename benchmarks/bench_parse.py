@@ -0,0 +1,56 @@
+"""Compara o parse_payload original com decodificar_payload / decodificar_lote.
+
+O parser original só fatia a string; o novo também desce nos templates 26 e
+62 e confere o CRC, então faz mais trabalho por payload. ``campos_payload``
+é o caminho rápido de ``GeradorPix.parse_payload``: valida só o nível
+superior, como o original.
+
+Uso: python benchmarks/bench_parse.py [n]
+"""
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from decodificador import campos_payload, decodificar_lote, decodificar_payload
+from template import PayloadTemplate
+
+
+def parse_payload_original(payload):
+    """Implementação original de GeradorPix.parse_payload (sem validação)"""
+    result = {}
+    i = 0
+    while i < len(payload) - 4:
+        id_campo = payload[i:i+2]
+        tamanho = int(payload[i+2:i+4])
+        valor = payload[i+4:i+4+tamanho]
+        result[id_campo] = valor
+        i += 4 + tamanho
+    result["63"] = payload[-4:]
+    return result
+
+
+def medir(nome, funcao, n):
+    inicio = time.perf_counter()
+    funcao()
+    decorrido = time.perf_counter() - inicio
+    print(f"{nome:38} {n / decorrido:12,.0f} payloads/s")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    template = PayloadTemplate("fortes.barman@gmail.com", "LOJA EXEMPLO", "SAO PAULO")
+    payloads = [template.render(Decimal(i % 100000) / 100, f"PEDIDO{i:08d}") for i in range(n)]
+    em_bytes = [p.encode("ascii") for p in payloads]
+
+    medir("parse_payload original (str)", lambda: [parse_payload_original(p) for p in payloads], n)
+    medir("campos_payload (str)", lambda: [campos_payload(p) for p in payloads], n)
+    medir("decodificar_payload (str)", lambda: [decodificar_payload(p) for p in payloads], n)
+    medir("decodificar_payload (bytes)", lambda: [decodificar_payload(p) for p in em_bytes], n)
+    medir("decodificar_lote (bytes)", lambda: list(decodificar_lote(em_bytes)), n)
+
+
+if __name__ == "__main__":
+    main()
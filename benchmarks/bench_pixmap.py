@@ -0,0 +1,58 @@
+"""Compara a conversão PIL -> PNG -> QPixmap com a criação direta de um QImage
+sobre o buffer 1-bit, nos tamanhos permitidos pelo campo qr_size da interface.
+
+Uso: python benchmarks/bench_pixmap.py [repeticoes]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QBuffer
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+import qr
+
+PAYLOAD = ("00020126450014BR.GOV.BCB.PIX0123fortes.barman@gmail.com520400005303986540510.00"
+           "5802BR5901N6001C62120508testepix6304909F")
+
+
+def via_png(matriz, size):
+    """Caminho anterior: imagem Pillow salva como PNG num QBuffer e decodificada"""
+    img = qr.renderizar_matriz(matriz, size)
+    buffer = QBuffer()
+    buffer.open(QBuffer.OpenModeFlag.ReadWrite)
+    img.save(buffer, format="PNG")
+    pixmap = QPixmap()
+    pixmap.loadFromData(buffer.data())
+    buffer.close()
+    return pixmap
+
+
+def via_qimage(matriz, size):
+    """Caminho novo: QImage Format_Mono sobre os pixels empacotados"""
+    dados, bytes_linha = qr.empacotar_matriz(matriz, size)
+    imagem = QImage(dados, size, size, bytes_linha, QImage.Format.Format_Mono)
+    imagem.setColorTable([0xFF000000, 0xFFFFFFFF])
+    return QPixmap.fromImage(imagem)
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    app = QApplication(sys.argv)
+    matriz = qr.gerar_matriz(PAYLOAD)
+    print("tempo por QR code a partir da matriz já calculada")
+    print(f"{'tamanho':>8} {'via PNG':>10} {'QImage':>10} {'ganho':>7}")
+    for size in range(100, 1001, 100):
+        png = min(timeit.repeat(lambda: via_png(matriz, size), number=repeticoes, repeat=3))
+        direto = min(timeit.repeat(lambda: via_qimage(matriz, size), number=repeticoes, repeat=3))
+        ms = 1000 / repeticoes
+        print(f"{size:>6}px {png * ms:8.3f}ms {direto * ms:8.3f}ms {png / direto:6.1f}x")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compara a latência de checkout do Pix dinâmico com e sem o pool.
+
+Sem o pool, cada checkout cria a location no PSP, monta o payload, renderiza
+o QR code e cria a cobrança; com o pool, só retira um item pronto e cria a
+cobrança. O PSP é o ``psp.PSPLocal`` com latência simulada, e os checkouts
+chegam espaçados por ``--intervalo`` para o pool ter tempo de se reabastecer.
+Como a renderização no reabastecimento disputa o GIL com o checkout, vale
+comparar ``--minimo`` e ``--concorrencia`` olhando o p99.
+
+Uso: python benchmarks/bench_pool_dinamico.py [--checkouts 200] [--latencia 20] [--intervalo 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pool_dinamico import PoolDinamico
+from psp import PSPLocal
+
+CHAVE = "fortes.barman@gmail.com"
+
+
+def medir(checkout, quantidade, intervalo):
+    """Executa ``quantidade`` checkouts espaçados e retorna as latências em segundos"""
+    latencias = []
+    for i in range(quantidade):
+        inicio = time.perf_counter()
+        checkout(10 + i / 100)
+        latencias.append(time.perf_counter() - inicio)
+        time.sleep(intervalo)
+    return latencias
+
+
+def relatar(nome, latencias):
+    latencias = sorted(latencias)
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"{nome:14} p50 {statistics.median(latencias) * 1000:8.2f} ms   p99 {p99 * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência de checkout do Pix dinâmico com e sem pool.")
+    parser.add_argument("--checkouts", type=int, default=200)
+    parser.add_argument("--latencia", type=float, default=20.0, help="latência do PSP por chamada, em ms")
+    parser.add_argument("--intervalo", type=float, default=5.0, help="intervalo entre checkouts, em ms")
+    parser.add_argument("--tamanho", type=int, default=64, help="tamanho do pool")
+    parser.add_argument("--minimo", type=int, default=None, help="ocupação que dispara o reabastecimento")
+    parser.add_argument("--concorrencia", type=int, default=4, help="preparações simultâneas no pool")
+    args = parser.parse_args()
+
+    psp = PSPLocal(args.latencia / 1000)
+    sem_pool = PoolDinamico(psp, CHAVE, tamanho=1)  # nunca iniciado: todo checkout prepara na hora
+    relatar("sob demanda", medir(sem_pool.cobrar, args.checkouts, args.intervalo / 1000))
+
+    with PoolDinamico(psp, CHAVE, tamanho=args.tamanho, minimo=args.minimo,
+                      concorrencia=args.concorrencia) as pool:
+        pool.aguardar()
+        relatar("com pool", medir(pool.cobrar, args.checkouts, args.intervalo / 1000))
+        estatisticas = pool.estatisticas()
+    print(f"pool: {estatisticas['retiradas']} retiradas, {estatisticas['faltas']} preparadas na hora")
+
+
+if __name__ == "__main__":
+    main()
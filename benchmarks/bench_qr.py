@@ -0,0 +1,57 @@
+"""Compara a renderização antiga do QR code (box_size=10 + resize LANCZOS)
+com a renderização direta da matriz em módulos de tamanho inteiro.
+
+Uso: python benchmarks/bench_qr.py [repeticoes]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qrcode
+from PIL import Image
+
+import qr
+
+PAYLOAD = ("00020126450014BR.GOV.BCB.PIX0123fortes.barman@gmail.com520400005303986540510.00"
+           "5802BR5901N6001C62120508testepix6304909F")
+
+
+def codificar(payload):
+    """Codificação usada pela implementação original (gera a matriz)"""
+    codigo = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_M, box_size=10, border=4)
+    codigo.add_data(payload)
+    codigo.make(fit=True)
+    return codigo
+
+
+def desenho_antigo(codigo, size):
+    """Desenho usado pela implementação original: box_size=10 + resize"""
+    img = codigo.make_image(fill_color="black", back_color="white")
+    return img.resize((size, size), Image.LANCZOS)
+
+
+def caminho_antigo(payload, size):
+    """Implementação original de GeradorPix.gerar_qrcode_pillow"""
+    return desenho_antigo(codificar(payload), size)
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    matriz = qr.gerar_matriz(PAYLOAD)
+    codigo = codificar(PAYLOAD)
+    print("tempo por QR code; 'desenho' exclui a codificação da matriz, que é igual nos dois caminhos")
+    print(f"{'tamanho':>8} {'antigo':>9} {'novo':>9} {'desenho antigo':>15} {'desenho novo':>13} {'ganho desenho':>14}")
+    for size in range(100, 1001, 100):
+        antigo = min(timeit.repeat(lambda: caminho_antigo(PAYLOAD, size), number=repeticoes, repeat=3))
+        novo = min(timeit.repeat(lambda: qr.gerar_qrcode_pillow(PAYLOAD, size), number=repeticoes, repeat=3))
+        d_antigo = min(timeit.repeat(lambda: desenho_antigo(codigo, size), number=repeticoes, repeat=3))
+        d_novo = min(timeit.repeat(lambda: qr.renderizar_matriz(matriz, size), number=repeticoes, repeat=3))
+        ms = 1000 / repeticoes
+        print(f"{size:>6}px {antigo * ms:7.2f}ms {novo * ms:7.2f}ms {d_antigo * ms:13.3f}ms "
+              f"{d_novo * ms:11.3f}ms {d_antigo / d_novo:13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
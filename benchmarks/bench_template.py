@@ -0,0 +1,48 @@
+"""Compara GeradorPix.gerar_payload com PayloadTemplate.render.
+
+Uso: python benchmarks/bench_template.py [n]
+"""
+import os
+import sys
+import timeit
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gerador import GeradorPix
+from template import PayloadTemplate
+
+CHAVE = "fortes.barman@gmail.com"
+NOME = "LOJA EXEMPLO"
+CIDADE = "SAO PAULO"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    gerador = GeradorPix()
+    template = PayloadTemplate(CHAVE, NOME, CIDADE)
+    valores = [Decimal(i) / 100 for i in range(1, 1001)]
+    txids = [f"PEDIDO{i:08d}" for i in range(1000)]
+
+    for valor, txid in zip(valores, txids):
+        assert template.render(valor, txid) == gerador.gerar_payload(CHAVE, valor, txid, NOME, CIDADE)
+
+    def antigo():
+        for valor, txid in zip(valores, txids):
+            gerador.gerar_payload(CHAVE, valor, txid, NOME, CIDADE)
+
+    def novo():
+        for valor, txid in zip(valores, txids):
+            template.render(valor, txid)
+
+    repeticoes = max(1, n // len(valores))
+    t_antigo = min(timeit.repeat(antigo, number=repeticoes, repeat=3))
+    t_novo = min(timeit.repeat(novo, number=repeticoes, repeat=3))
+    total = repeticoes * len(valores)
+    print(f"gerar_payload          : {total / t_antigo:12,.0f} payloads/s")
+    print(f"PayloadTemplate.render : {total / t_novo:12,.0f} payloads/s")
+    print(f"ganho                  : {t_antigo / t_novo:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
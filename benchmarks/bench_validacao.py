@@ -0,0 +1,40 @@
+"""Compara a validação de chaves Pix uma a uma com a validação vetorizada.
+
+Usa as chaves sorteadas pela suíte de benchmarks (todos os tipos, com
+dígitos verificadores aleatórios, então a maioria dos CPFs e CNPJs é
+rejeitada). Precisa do NumPy.
+
+Uso: python benchmarks/bench_validacao.py [n]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from suite import gerar_dados
+from validacao import validar_chave, validar_lote
+
+
+def medir(nome, funcao, n):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    decorrido = time.perf_counter() - inicio
+    print(f"{nome:38} {n / decorrido:12,.0f} chaves/s")
+    return resultado
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    base = [linha[0] for linha in gerar_dados(min(n, 50000))]
+    chaves = (base * (n // len(base) + 1))[:n]
+
+    um_a_um = medir("validar_chave (tipo deduzido)", lambda: [validar_chave(c) for c in chaves], n)
+    lote = medir("validar_lote (tipo deduzido)", lambda: validar_lote(chaves), n)
+    assert list(lote) == um_a_um
+    sem_email = [c for c in chaves if "@" not in c]
+    medir("validar_lote (sem e-mails)", lambda: validar_lote(sem_email), len(sem_email))
+
+
+if __name__ == "__main__":
+    main()
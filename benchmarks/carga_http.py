@@ -0,0 +1,86 @@
+"""Teste de carga do servidor.py em localhost.
+
+Abre ``--conexoes`` conexões keep-alive e envia ``--requisicoes`` pedidos no
+total, reportando requisições por segundo e latências p50/p99.
+
+Uso:
+    python servidor.py &
+    python benchmarks/carga_http.py [--rota payload|qrcode|batch] [--conexoes 32] [--requisicoes 5000]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+COBRANCA = {"chave_pix": "fortes.barman@gmail.com", "valor": "10.00", "txid": "testepix",
+            "nome_merchant": "LOJA EXEMPLO", "cidade_merchant": "SAO PAULO"}
+
+
+def montar_requisicao(rota, host):
+    """Monta os bytes de uma requisição HTTP/1.1 keep-alive para a rota pedida"""
+    if rota == "qrcode":
+        consulta = "&".join(f"{k}={v}" for k, v in COBRANCA.items()).replace("@", "%40").replace(" ", "+")
+        return f"GET /qrcode.png?{consulta}&size=300 HTTP/1.1\r\nHost: {host}\r\n\r\n".encode()
+    if rota == "batch":
+        corpo = json.dumps([dict(COBRANCA, txid=f"T{i}") for i in range(100)]).encode()
+        caminho = "/batch"
+    else:
+        corpo = json.dumps(COBRANCA).encode()
+        caminho = "/payload"
+    return (f"POST {caminho} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(corpo)}\r\n\r\n").encode() + corpo
+
+
+async def cliente(host, porta, requisicao, quantidade, latencias, erros):
+    """Uma conexão keep-alive que envia ``quantidade`` requisições em sequência"""
+    reader, writer = await asyncio.open_connection(host, porta)
+    try:
+        for _ in range(quantidade):
+            inicio = time.perf_counter()
+            writer.write(requisicao)
+            cabecalho = await reader.readuntil(b"\r\n\r\n")
+            tamanho = 0
+            for linha in cabecalho.split(b"\r\n"):
+                if linha.lower().startswith(b"content-length:"):
+                    tamanho = int(linha.split(b":", 1)[1])
+            await reader.readexactly(tamanho)
+            latencias.append(time.perf_counter() - inicio)
+            if not cabecalho.startswith(b"HTTP/1.1 200"):
+                erros.append(cabecalho.split(b"\r\n", 1)[0].decode())
+    finally:
+        writer.close()
+
+
+async def executar(args):
+    requisicao = montar_requisicao(args.rota, args.host)
+    latencias, erros = [], []
+    por_conexao, resto = divmod(args.requisicoes, args.conexoes)
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        cliente(args.host, args.porta, requisicao, por_conexao + (i < resto), latencias, erros)
+        for i in range(args.conexoes)
+    ))
+    decorrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"rota {args.rota}: {len(latencias)} requisições, {args.conexoes} conexões, {decorrido:.2f}s")
+    print(f"  {len(latencias) / decorrido:,.0f} req/s")
+    print(f"  p50 {statistics.median(latencias) * 1000:.2f} ms   p99 {p99 * 1000:.2f} ms")
+    if erros:
+        print(f"  {len(erros)} respostas com erro, ex.: {erros[0]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor Pix local.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--rota", choices=["payload", "qrcode", "batch"], default="payload")
+    parser.add_argument("--conexoes", type=int, default=32)
+    parser.add_argument("--requisicoes", type=int, default=5000)
+    asyncio.run(executar(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
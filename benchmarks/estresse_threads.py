@@ -0,0 +1,77 @@
+"""Teste de estresse: uma única instância de GeradorPix compartilhada por muitas threads.
+
+Cada thread gera payloads para as suas próprias cobranças e confere cada um
+com ``PayloadTemplate.render``, que não compartilha estado. Para comparação,
+roda o mesmo teste com a implementação original, que guardava os campos em
+``self.payload`` e mistura payloads de threads diferentes.
+
+Uso: python benchmarks/estresse_threads.py [threads] [cobrancas_por_thread]
+"""
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crc16 import crc16_hex
+from gerador import GeradorPix
+from suite import gerar_dados
+from template import PayloadTemplate
+
+
+class GeradorOriginal:
+    """Implementação original de GeradorPix.gerar_payload, com estado na instância"""
+
+    def __init__(self):
+        self.payload = {}
+
+    def _adicionar_valor(self, id_campo, valor):
+        if valor is not None:
+            valor_str = str(valor)
+            self.payload[id_campo] = id_campo + f"{len(valor_str):02d}" + valor_str
+
+    def gerar_payload(self, chave_pix, valor=None, txid="***", nome_merchant="N", cidade_merchant="C"):
+        self.payload = {}
+        self._adicionar_valor("00", "01")
+        self._adicionar_valor("26", f"0014BR.GOV.BCB.PIX01{len(chave_pix):02d}{chave_pix}")
+        self._adicionar_valor("52", "0000")
+        self._adicionar_valor("53", "986")
+        if valor is not None and valor > 0:
+            self._adicionar_valor("54", f"{valor:.2f}")
+        self._adicionar_valor("58", "BR")
+        self._adicionar_valor("59", nome_merchant)
+        self._adicionar_valor("60", cidade_merchant)
+        self._adicionar_valor("62", f"05{len(txid):02d}{txid}")
+        payload_sem_crc = "".join(self.payload.values()) + "6304"
+        return payload_sem_crc + crc16_hex(payload_sem_crc)
+
+
+def estressar(gerador, threads, por_thread):
+    """Roda ``threads`` threads sobre o mesmo gerador e retorna quantos payloads saíram errados"""
+    dados = gerar_dados(threads * por_thread)
+    barreira = threading.Barrier(threads)
+
+    def trabalhar(indice):
+        linhas = dados[indice * por_thread:(indice + 1) * por_thread]
+        esperados = [PayloadTemplate(c, n, ci).render(v, t) for c, v, t, n, ci in linhas]
+        barreira.wait()
+        return sum(gerador.gerar_payload(*linha) != esperado for linha, esperado in zip(linhas, esperados))
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return sum(executor.map(trabalhar, range(threads)))
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    por_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    sys.setswitchinterval(1e-6)  # troca de thread o mais frequente possível, para expor as corridas
+    total = threads * por_thread
+    for nome, gerador in (("original (self.payload)", GeradorOriginal()), ("GeradorPix", GeradorPix())):
+        errados = estressar(gerador, threads, por_thread)
+        print(f"{nome:24} {errados:8} de {total} payloads errados")
+    return 0 if errados == 0 else 1  # só o GeradorPix atual precisa passar
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""Suíte de benchmarks e regressão dos caminhos críticos do Gerador Pix.
+
+Mede CRC, geração de payload, decodificação e renderização de QR code sobre
+um conjunto de dados fixo (semente constante) com chaves de todos os tipos,
+valores variados e txids de tamanhos diferentes. Para cada caminho registra
+operações por segundo, latências p50/p90/p99 e pico de memória alocada, em
+JSON.
+
+Antes das medidas, o CRC16 é conferido com uma implementação de
+referência bit a bit (sem tabela) sobre textos aleatórios, inclusive no
+cálculo incremental e em lote com prefixo.
+
+Uso:
+    python benchmarks/suite.py check
+    python benchmarks/suite.py run -o benchmarks/baseline.json
+    python benchmarks/suite.py run -o atual.json --baseline benchmarks/baseline.json
+    python benchmarks/suite.py compare benchmarks/baseline.json atual.json --limite 0.15
+
+O modo ``compare`` (ou ``run --baseline``) termina com código 1 se algum
+caminho ficar mais lento que a baseline além do limite.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache_qr import CacheQR
+from crc16 import CRC16, CRC_INICIAL, crc16, crc16_hex, crc16_lote
+from decodificador import decodificar_payload
+from gerador import GeradorPix
+
+SEMENTE = 20240601
+LIMITE_PADRAO = 0.15
+
+_app_qt = None  # QApplication mantida viva enquanto os QPixmaps são medidos
+
+
+def _chave(rng):
+    """Sorteia uma chave Pix de um dos cinco tipos"""
+    tipo = rng.randrange(5)
+    if tipo == 0:
+        usuario = "".join(rng.choices(string.ascii_lowercase + string.digits + ".", k=rng.randint(3, 30)))
+        return f"{usuario}@{rng.choice(['gmail.com', 'empresa.com.br', 'x.io'])}"
+    if tipo == 1:
+        return "".join(rng.choices(string.digits, k=11))
+    if tipo == 2:
+        return "".join(rng.choices(string.digits, k=14))
+    if tipo == 3:
+        return "+55" + "".join(rng.choices(string.digits, k=11))
+    hexa = "".join(rng.choices("0123456789abcdef", k=32))
+    return f"{hexa[:8]}-{hexa[8:12]}-{hexa[12:16]}-{hexa[16:20]}-{hexa[20:]}"
+
+
+def gerar_dados(n, semente=SEMENTE):
+    """Gera ``n`` cobranças (chave, valor, txid, nome, cidade) de forma reprodutível"""
+    rng = random.Random(semente)
+    dados = []
+    for _ in range(n):
+        valor = rng.choice([None, Decimal(rng.randint(1, 99999999)) / 100, Decimal(rng.randint(1, 500))])
+        txid = "".join(rng.choices(string.ascii_uppercase + string.digits, k=rng.choice([3, 8, 25, 35])))
+        nome = "".join(rng.choices(string.ascii_uppercase + " ", k=rng.randint(1, 25))).strip() or "N"
+        cidade = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 15)))
+        dados.append((_chave(rng), valor, txid, nome, cidade))
+    return dados
+
+
+def crc16_referencia(data, crc=CRC_INICIAL):
+    """CRC16/CCITT-FALSE calculado bit a bit (polinômio 0x1021), referência para o ``crc16``"""
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+    return crc
+
+
+def conferir_crc(n=500, semente=SEMENTE):
+    """Compara ``crc16``, ``CRC16`` e ``crc16_lote`` com a referência; retorna as divergências"""
+    rng = random.Random(semente)
+    divergencias = []
+    if crc16_referencia(b"123456789") != 0x29B1:  # valor de verificação do CRC16/CCITT-FALSE
+        divergencias.append(("referencia", "123456789"))
+    for _ in range(n):
+        texto = "".join(rng.choices(string.printable, k=rng.randint(0, 300)))
+        corte = rng.randint(0, len(texto))
+        prefixo, sufixo = texto[:corte], texto[corte:]
+        esperado = crc16_referencia(texto.encode("ascii"))
+        binario = rng.randbytes(rng.randint(0, 64))
+        base = CRC16(prefixo)
+        if crc16(texto) != esperado or crc16_hex(texto) != f"{esperado:04X}":
+            divergencias.append(("crc16", texto))
+        if crc16(binario) != crc16_referencia(binario):
+            divergencias.append(("crc16 bytes", binario))
+        if (base.copy().update(sufixo).digest() != esperado
+                or base.digest() != crc16_referencia(prefixo.encode("ascii"))):
+            divergencias.append(("CRC16.copy().update", texto))
+        sufixos = [sufixo, sufixo[::-1], ""]
+        esperados = [f"{crc16_referencia((prefixo + s).encode('ascii')):04X}" for s in sufixos]
+        if crc16_lote(sufixos, prefixo) != esperados or crc16_lote(sufixos, base) != esperados:
+            divergencias.append(("crc16_lote", texto))
+    return divergencias
+
+
+def _percentil(ordenados, fracao):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * fracao))]
+
+
+def medir(funcao, entradas, repeticoes=5, amostra_memoria=200):
+    """Executa ``funcao`` sobre cada entrada e retorna as métricas do caminho.
+
+    A passada completa é repetida ``repeticoes`` vezes e vale a mais rápida,
+    o que reduz o ruído de outros processos na máquina.
+    """
+    for entrada in entradas[:10]:
+        funcao(entrada)  # aquecimento
+
+    relogio = time.perf_counter_ns
+    melhor = None
+    for _ in range(repeticoes):
+        latencias = []
+        inicio = relogio()
+        for entrada in entradas:
+            t = relogio()
+            funcao(entrada)
+            latencias.append(relogio() - t)
+        total = relogio() - inicio
+        if melhor is None or total < melhor[0]:
+            melhor = (total, latencias)
+    total, latencias = melhor
+
+    tracemalloc.start()
+    for entrada in entradas[:amostra_memoria]:
+        funcao(entrada)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencias.sort()
+    return {
+        "n": len(entradas),
+        "ops_por_segundo": len(entradas) / (total / 1e9),
+        "p50_us": _percentil(latencias, 0.50) / 1000,
+        "p90_us": _percentil(latencias, 0.90) / 1000,
+        "p99_us": _percentil(latencias, 0.99) / 1000,
+        "pico_memoria_bytes": pico,
+    }
+
+
+def caminhos(n, n_qr):
+    """Monta os caminhos a medir como (nome, função, entradas)"""
+    global _app_qt
+    dados = gerar_dados(n)
+    gerador = GeradorPix(CacheQR(max_itens=0))
+    payloads = [gerador.gerar_payload(*linha) for linha in dados]
+    sem_crc = [p[:-4] for p in payloads]
+    templates = {}
+    for chave, _, _, nome, cidade in dados:
+        templates.setdefault((chave, nome, cidade), gerador.compilar_template(chave, nome, cidade))
+    renders = [(templates[(c, n_, ci)], v, t) for c, v, t, n_, ci in dados]
+    tamanhos = [100 + (i * 97) % 901 for i in range(n_qr)]
+    qrs = list(zip(payloads[:n_qr], tamanhos))
+
+    lista = [
+        ("calculate_crc16", gerador.calculate_crc16, sem_crc),
+        ("gerar_payload", lambda linha: gerador.gerar_payload(*linha), dados),
+        ("template_render", lambda r: r[0].render(r[1], r[2]), renders),
+        ("parse_payload", gerador.parse_payload, payloads),
+        ("decodificar_payload", decodificar_payload, payloads),
+        ("gerar_qrcode_pillow", lambda q: gerador.gerar_qrcode_pillow(*q), qrs),
+    ]
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        _app_qt = QApplication.instance() or QApplication([])
+        lista.append(("gerar_qrcode_pixmap", lambda q: gerador.gerar_qrcode_pixmap(*q), qrs))
+    except ImportError:
+        print("PyQt6 indisponível: gerar_qrcode_pixmap não será medido", file=sys.stderr)
+    return lista
+
+
+def executar(n=5000, n_qr=200, filtro=None, repeticoes=5):
+    """Roda a suíte e retorna o relatório em formato JSON-serializável"""
+    relatorio = {
+        "semente": SEMENTE,
+        "repeticoes": repeticoes,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "resultados": {},
+    }
+    for nome, funcao, entradas in caminhos(n, n_qr):
+        if filtro and filtro not in nome:
+            continue
+        metricas = medir(funcao, entradas, repeticoes)
+        relatorio["resultados"][nome] = metricas
+        print(f"{nome:22} {metricas['ops_por_segundo']:12,.0f} ops/s  p50 {metricas['p50_us']:9.1f}us  "
+              f"p99 {metricas['p99_us']:9.1f}us  pico {metricas['pico_memoria_bytes'] / 1024:8.1f} KiB",
+              file=sys.stderr)
+    return relatorio
+
+
+def comparar(baseline, atual, limite=LIMITE_PADRAO):
+    """Compara dois relatórios e retorna a lista de regressões encontradas.
+
+    Um caminho regride se suas operações por segundo caírem mais que
+    ``limite`` (fração) em relação à baseline.
+    """
+    regressoes = []
+    for nome, base in baseline["resultados"].items():
+        medido = atual["resultados"].get(nome)
+        if medido is None:
+            continue
+        variacao = medido["ops_por_segundo"] / base["ops_por_segundo"] - 1
+        situacao = "REGRESSÃO" if variacao < -limite else "ok"
+        print(f"{nome:22} {base['ops_por_segundo']:12,.0f} -> {medido['ops_por_segundo']:12,.0f} ops/s "
+              f"({variacao:+.1%}) {situacao}", file=sys.stderr)
+        if variacao < -limite:
+            regressoes.append((nome, variacao))
+    return regressoes
+
+
+def _carregar(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks e regressão do Gerador Pix.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    check = sub.add_parser("check", help="confere o CRC16 com a implementação de referência")
+    check.add_argument("-n", type=int, default=5000, help="textos aleatórios conferidos")
+
+    run = sub.add_parser("run", help="executa a suíte")
+    run.add_argument("-o", "--saida", help="arquivo JSON de resultados (padrão: saída padrão)")
+    run.add_argument("-n", type=int, default=5000, help="cobranças por caminho de payload/CRC")
+    run.add_argument("--n-qr", type=int, default=200, help="QR codes por caminho de renderização")
+    run.add_argument("-r", "--repeticoes", type=int, default=5, help="passadas por caminho (vale a mais rápida)")
+    run.add_argument("-k", "--filtro", help="mede apenas os caminhos cujo nome contém o texto")
+    run.add_argument("--baseline", help="compara com esta baseline ao final")
+    run.add_argument("--limite", type=float, default=LIMITE_PADRAO, help="queda máxima tolerada (fração)")
+
+    compare = sub.add_parser("compare", help="compara dois arquivos de resultados")
+    compare.add_argument("baseline")
+    compare.add_argument("atual")
+    compare.add_argument("--limite", type=float, default=LIMITE_PADRAO, help="queda máxima tolerada (fração)")
+
+    args = parser.parse_args(argv)
+    divergencias = conferir_crc(args.n if args.comando == "check" else 500)
+    for caminho, entrada in divergencias[:10]:
+        print(f"CRC16 divergente da referência em {caminho}: {entrada!r}", file=sys.stderr)
+    if divergencias:
+        return 1
+    if args.comando == "check":
+        print("CRC16 confere com a referência", file=sys.stderr)
+        return 0
+    if args.comando == "run":
+        relatorio = executar(args.n, args.n_qr, args.filtro, args.repeticoes)
+        texto = json.dumps(relatorio, indent=2, ensure_ascii=False)
+        if args.saida:
+            with open(args.saida, "w", encoding="utf-8") as f:
+                f.write(texto + "\n")
+        else:
+            print(texto)
+        if not args.baseline:
+            return 0
+        baseline, atual = _carregar(args.baseline), relatorio
+    else:
+        baseline, atual = _carregar(args.baseline), _carregar(args.atual)
+
+    regressoes = comparar(baseline, atual, args.limite)
+    if regressoes:
+        print(f"{len(regressoes)} caminho(s) regrediram além de {args.limite:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Cache persistente em disco (SQLite) de payloads e QR codes já gerados.
+
+As entradas são endereçadas pelo conteúdo: a chave é o SHA-256 da tupla
+canônica de entrada (os argumentos de ``gerar_payload``, ou o payload mais
+as opções de renderização), então processos e máquinas diferentes que
+compartilham o arquivo reaproveitam o trabalho uns dos outros. O banco usa
+WAL e ``busy_timeout``, o que permite leituras e escritas simultâneas de
+vários processos; o tamanho total é limitado e as entradas acessadas há
+mais tempo são removidas primeiro.
+
+Uma consulta que acerta o cache não importa o qrcode nem o Pillow.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache, partial
+
+from template import CamposPayload, formatar_valor
+
+MAX_BYTES_PADRAO = 256 * 1024 * 1024
+INTERVALO_ACESSO = 60.0  # segundos entre atualizações do instante de acesso de uma entrada
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS itens (
+    chave BLOB PRIMARY KEY,
+    dados BLOB NOT NULL,
+    tamanho INTEGER NOT NULL,
+    acesso REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS itens_acesso ON itens (acesso);
+CREATE TABLE IF NOT EXISTS total (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+INSERT OR IGNORE INTO total VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS itens_inclusao AFTER INSERT ON itens
+    BEGIN UPDATE total SET bytes = bytes + NEW.tamanho; END;
+CREATE TRIGGER IF NOT EXISTS itens_remocao AFTER DELETE ON itens
+    BEGIN UPDATE total SET bytes = bytes - OLD.tamanho; END;
+"""
+
+
+def chave_payload(chave_pix, valor=None, txid="***", nome_merchant="N", cidade_merchant="C"):
+    """Chave de cache dos argumentos de ``gerar_payload``.
+
+    O valor entra formatado por ``template.formatar_valor``, o mesmo do
+    campo 54, de modo que ``10``, ``10.0`` e ``Decimal("10.00")`` caem na
+    mesma entrada, como caem no mesmo payload.
+    """
+    valor = formatar_valor(valor)
+    return _resumo(["payload", chave_pix, valor, txid, nome_merchant, cidade_merchant])
+
+
+def chave_imagem(payload, size=300, formato="PNG", politica=None):
+    """Chave de cache de um QR code renderizado (``politica`` é a ``PoliticaQR``, se houver)"""
+    partes = ["imagem", payload, size, formato.upper()]
+    if politica is not None:
+        partes.append(list(politica))
+    return _resumo(partes)
+
+
+def _resumo(partes):
+    return hashlib.sha256(json.dumps(partes, default=str).encode("utf-8")).digest()
+
+
+class CacheDisco:
+    """Cache de bytes em um arquivo SQLite, limitado a ``max_bytes`` de dados.
+
+    Pode ser usado por várias threads (as operações são serializadas por
+    instância) e por vários processos ao mesmo tempo. Depois de um ``fork``
+    a conexão é reaberta automaticamente no processo filho.
+    """
+
+    def __init__(self, caminho, max_bytes=MAX_BYTES_PADRAO):
+        self.caminho = caminho
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conexao = None
+        self._pid = None
+
+    def _conectar(self):
+        if self._conexao is None or self._pid != os.getpid():
+            conexao = sqlite3.connect(self.caminho, timeout=30, isolation_level=None, check_same_thread=False)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.executescript(_ESQUEMA)
+            self._conexao = conexao
+            self._pid = os.getpid()
+        return self._conexao
+
+    def obter(self, chave):
+        """Retorna os bytes guardados em ``chave`` ou None"""
+        with self._lock:
+            conexao = self._conectar()
+            linha = conexao.execute("SELECT dados, acesso FROM itens WHERE chave = ?", (chave,)).fetchone()
+            if linha is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            agora = time.time()
+            if agora - linha[1] > INTERVALO_ACESSO:
+                # Atualizar o acesso a cada leitura transformaria toda leitura em escrita
+                conexao.execute("UPDATE itens SET acesso = ? WHERE chave = ?", (agora, chave))
+            return linha[0]
+
+    def guardar(self, chave, dados):
+        """Guarda ``dados`` em ``chave`` e remove as entradas mais antigas se passar do limite"""
+        if len(dados) > self.max_bytes:
+            return
+        with self._lock:
+            conexao = self._conectar()
+            conexao.execute("BEGIN IMMEDIATE")
+            try:
+                conexao.execute("INSERT OR IGNORE INTO itens VALUES (?, ?, ?, ?)",
+                                (chave, dados, len(dados), time.time()))
+                total = conexao.execute("SELECT bytes FROM total").fetchone()[0]
+                if total > self.max_bytes:
+                    self._remover_antigos(conexao, total - self.max_bytes * 9 // 10)
+                conexao.execute("COMMIT")
+            except BaseException:
+                conexao.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _remover_antigos(conexao, excesso):
+        """Remove as entradas de acesso mais antigo até liberar ``excesso`` bytes"""
+        liberados = 0
+        remover = []
+        for chave, tamanho in conexao.execute("SELECT chave, tamanho FROM itens ORDER BY acesso"):
+            remover.append((chave,))
+            liberados += tamanho
+            if liberados >= excesso:
+                break
+        conexao.executemany("DELETE FROM itens WHERE chave = ?", remover)
+
+    def payload(self, chave_pix, valor=None, txid="***", nome_merchant="N", cidade_merchant="C"):
+        """Retorna o payload, gerando-o e guardando-o só se ainda não estiver no cache"""
+        chave = chave_payload(chave_pix, valor, txid, nome_merchant, cidade_merchant)
+        dados = self.obter(chave)
+        if dados is not None:
+            return dados.decode("ascii")
+        payload = CamposPayload.montar(chave_pix, valor, txid, nome_merchant, cidade_merchant).payload()
+        self.guardar(chave, payload.encode("ascii"))
+        return payload
+
+    def imagem(self, payload, size=300, formato="PNG", gerar=None, politica=None):
+        """Retorna o QR code codificado, renderizando-o só se ainda não estiver no cache.
+
+        Em caso de falta, os bytes vêm de ``gerar(payload, formato, size)``;
+        o padrão é ``qr.gerar_qrcode_bytes`` com a ``politica`` de
+        codificação, importado só nesse momento.
+        """
+        chave = chave_imagem(payload, size, formato, politica)
+        dados = self.obter(chave)
+        if dados is None:
+            if gerar is None:
+                from qr import gerar_qrcode_bytes
+                gerar = partial(gerar_qrcode_bytes, politica=politica)
+            dados = gerar(payload, formato, size)
+            self.guardar(chave, dados)
+        return dados
+
+    def limpar(self):
+        """Remove todas as entradas (os contadores são mantidos)"""
+        with self._lock:
+            self._conectar().execute("DELETE FROM itens")
+
+    def estatisticas(self):
+        """Retorna os contadores deste processo e a ocupação atual do arquivo"""
+        with self._lock:
+            conexao = self._conectar()
+            itens = conexao.execute("SELECT COUNT(*) FROM itens").fetchone()[0]
+            total = conexao.execute("SELECT bytes FROM total").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "itens": itens, "bytes": total}
+
+    def fechar(self):
+        """Fecha a conexão; ela é reaberta se o cache voltar a ser usado"""
+        with self._lock:
+            if self._conexao is not None and self._pid == os.getpid():
+                self._conexao.close()
+            self._conexao = None
+
+
+@lru_cache(maxsize=None)
+def abrir(caminho, max_bytes=MAX_BYTES_PADRAO):
+    """Retorna o ``CacheDisco`` de ``caminho`` deste processo, criando-o na primeira vez"""
+    return CacheDisco(caminho, max_bytes)
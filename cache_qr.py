@@ -0,0 +1,120 @@
+"""Cache LRU, limitado e thread-safe, de QR codes já renderizados."""
+import threading
+from collections import OrderedDict
+
+# Extensões de arquivo aceitas por salvar_qrcode e o formato de exportação correspondente
+FORMATOS = {".png": "PNG", ".jpg": "JPEG", ".jpeg": "JPEG", ".bmp": "BMP", ".gif": "GIF", ".svg": "SVG",
+            ".pdf": "PDF"}
+
+
+def _tamanho_matriz(matriz):
+    """Estimativa do espaço ocupado por uma matriz de módulos (lista de listas)"""
+    n = len(matriz)
+    return n * n * 8 + n * 56
+
+
+class CacheQR:
+    """Cache de matrizes de módulos e de imagens codificadas.
+
+    As matrizes ficam indexadas pelo payload e as imagens por
+    ``(payload, size, formato)``; um pedido repetido não passa nem pela
+    codificação do QR nem pela compressão da imagem. A remoção segue a ordem
+    LRU sempre que ``max_itens`` ou ``max_bytes`` são ultrapassados; com
+    ``max_itens=0`` nada é guardado. Com um ``cache_disco.CacheDisco`` em
+    ``disco``, as imagens que faltam na memória são procuradas no disco
+    antes de serem renderizadas. Com uma ``codificacao_qr.PoliticaQR`` em
+    ``politica``, as matrizes usam a codificação adaptativa.
+    """
+
+    def __init__(self, max_itens=256, max_bytes=32 * 1024 * 1024, disco=None, politica=None):
+        self.max_itens = max_itens
+        self.max_bytes = max_bytes
+        self.disco = disco
+        self.politica = politica
+        self._itens = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _obter(self, chave):
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                self.misses += 1
+                return None
+            self._itens.move_to_end(chave)
+            self.hits += 1
+            return item[0]
+
+    def _guardar(self, chave, valor, tamanho):
+        if tamanho > self.max_bytes or self.max_itens < 1:
+            return
+        with self._lock:
+            anterior = self._itens.pop(chave, None)
+            if anterior is not None:
+                self._bytes -= anterior[1]
+            self._itens[chave] = (valor, tamanho)
+            self._bytes += tamanho
+            while len(self._itens) > self.max_itens or self._bytes > self.max_bytes:
+                _, (_, removido) = self._itens.popitem(last=False)
+                self._bytes -= removido
+                self.evictions += 1
+
+    def matriz(self, payload):
+        """Retorna a matriz de módulos do payload, calculando-a só na primeira vez"""
+        chave = ("matriz", payload)
+        matriz = self._obter(chave)
+        if matriz is None:
+            import qr
+            matriz = qr.gerar_matriz(payload, self.politica)
+            self._guardar(chave, matriz, _tamanho_matriz(matriz))
+        return matriz
+
+    def pixels(self, payload, size=300):
+        """Retorna ``(dados, bytes_por_linha)`` com os pixels 1-bit do QR code, sem codificação"""
+        chave = ("pixels", payload, size)
+        pixels = self._obter(chave)
+        if pixels is None:
+            import qr
+            pixels = qr.empacotar_matriz(self.matriz(payload), size)
+            self._guardar(chave, pixels, len(pixels[0]))
+        return pixels
+
+    def imagem(self, payload, size=300, formato="PNG"):
+        """Retorna os bytes do QR code já codificado em ``formato`` (veja ``qr.exportar_matriz``)"""
+        formato = formato.upper()
+        chave = ("imagem", payload, size, formato)
+        dados = self._obter(chave)
+        if dados is None:
+            if self.disco is not None:
+                dados = self.disco.imagem(payload, size, formato, self._codificar, self.politica)
+            else:
+                dados = self._codificar(payload, formato, size)
+            self._guardar(chave, dados, len(dados))
+        return dados
+
+    def _codificar(self, payload, formato, size):
+        import qr
+        return qr.exportar_matriz(self.matriz(payload), formato, size)
+
+    def limpar(self):
+        """Esvazia o cache (os contadores são mantidos)"""
+        with self._lock:
+            self._itens.clear()
+            self._bytes = 0
+
+    def estatisticas(self):
+        """Retorna os contadores e a ocupação atual do cache"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "itens": len(self._itens),
+                "bytes": self._bytes,
+            }
+
+
+cache_padrao = CacheQR()
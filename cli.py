@@ -0,0 +1,269 @@
+"""Geração de payloads e QR codes Pix em lote pela linha de comando.
+
+Lê cobranças em CSV ou JSONL (de um arquivo ou da entrada padrão) e escreve
+um JSON por linha com o payload gerado. Não usa o PyQt6, então roda em
+servidores sem interface gráfica.
+
+Exemplos::
+
+    python cli.py cobrancas.csv -o payloads.jsonl
+    python cli.py cobrancas.jsonl --qr-dir qrcodes --qr-formato svg
+    cat cobrancas.csv | python cli.py --formato csv --qr-zip qrcodes.zip
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from decimal import Decimal, InvalidOperation
+from functools import partial
+
+from lote import CAMPOS, PADROES, mapear_em_blocos, obter_template
+from template import formatar_valor
+from validacao import MENSAGENS_ERRO, OK, validar_chave
+
+INTERVALO_RELATORIO = 5.0
+
+
+def ler_linhas(arquivo, formato):
+    """Lê as cobranças de ``arquivo`` uma a uma, sem carregar tudo em memória.
+
+    No CSV cada linha já sai como dict; no JSONL sai o texto da linha, que é
+    decodificado em ``normalizar`` para que uma linha malformada não
+    interrompa o processamento.
+    """
+    if formato == "csv":
+        yield from csv.DictReader(arquivo)
+    else:
+        for linha in arquivo:
+            if linha.strip():
+                yield linha
+
+
+def _valor(valor):
+    """Converte o valor de entrada em Decimal; aceita vírgula como separador.
+
+    Vazio ou zero geram um Pix sem valor (campo 54 ausente). Valores
+    negativos, não finitos, com mais de duas casas decimais ou que não
+    cabem nos 13 caracteres do campo 54 são rejeitados, em vez de virarem
+    um Pix de valor livre ou um campo inválido.
+    """
+    if valor is None or valor == "":
+        return None
+    if isinstance(valor, bool):
+        raise ValueError(f"valor inválido: {valor!r}")
+    if isinstance(valor, str):
+        valor = valor.strip().replace(",", ".")
+    elif isinstance(valor, float):
+        valor = repr(valor)
+    try:
+        decimal = Decimal(valor)
+    except (InvalidOperation, TypeError, ValueError):
+        raise ValueError(f"valor inválido: {valor!r}")
+    if not decimal.is_finite():
+        raise ValueError(f"valor inválido: {valor!r}")
+    if decimal < 0:
+        raise ValueError(f"valor negativo: {valor!r}")
+    try:
+        formatar_valor(decimal)  # mesma regra do campo 54 no payload
+    except ValueError:
+        raise ValueError(f"valor não cabe no campo 54: {valor!r}")
+    if decimal.as_tuple().exponent < -2 and decimal != round(decimal, 2):
+        raise ValueError(f"valor com mais de duas casas decimais: {valor!r}")
+    return decimal
+
+
+def normalizar(linha):
+    """Converte uma linha lida nos argumentos de gerar_payload, validando os campos"""
+    if isinstance(linha, str):
+        try:
+            linha = json.loads(linha)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido: {e}")
+    if not isinstance(linha, dict):
+        raise ValueError("cada linha deve ser um objeto com os campos da cobrança")
+    argumentos = []
+    for campo, padrao in zip(CAMPOS, PADROES):
+        valor = linha.get(campo)
+        if campo == "valor":
+            argumentos.append(_valor(valor))
+            continue
+        valor = str(valor).strip() if valor not in (None, "") else padrao
+        if valor is None:
+            raise ValueError(f"o campo {campo} é obrigatório")
+        if not valor.isascii():
+            raise ValueError(f"o campo {campo} deve conter apenas caracteres ASCII")
+        argumentos.append(valor)
+    return tuple(argumentos)
+
+
+def processar_bloco(bloco, formato_qr=None, tamanho_qr=300, cache_disco=None):
+    """Gera os registros de saída (e, se pedido, os QR codes) de um bloco.
+
+    ``bloco`` é uma lista de ``(numero_linha, argumentos, erro)``. Retorna uma
+    lista de ``(registro, imagem)``, com ``imagem`` em bytes ou ``None``.
+    Com ``cache_disco`` (caminho de um ``cache_disco.CacheDisco``), os QR
+    codes já gerados em execuções anteriores são lidos de lá.
+    """
+    if formato_qr and cache_disco:
+        from cache_disco import abrir
+        gerar_qrcode_bytes = partial(abrir(cache_disco).imagem, formato=formato_qr, size=tamanho_qr)
+    elif formato_qr:
+        from qr import gerar_qrcode_bytes as gerar
+        gerar_qrcode_bytes = partial(gerar, formato=formato_qr, size=tamanho_qr)
+
+    resultados = []
+    for numero, argumentos, erro in bloco:
+        imagem = None
+        if erro is None:
+            chave_pix, valor, txid, nome_merchant, cidade_merchant = argumentos
+            try:
+                payload = obter_template(chave_pix, nome_merchant, cidade_merchant).render(valor, txid)
+                if formato_qr:
+                    imagem = gerar_qrcode_bytes(payload)
+            except Exception as e:
+                erro = str(e)
+        if erro is None:
+            resultados.append(({"linha": numero, "txid": txid, "payload": payload}, imagem))
+        else:
+            resultados.append(({"linha": numero, "erro": erro}, None))
+    return resultados
+
+
+class DestinoQR:
+    """Grava os QR codes gerados em um diretório ou em um arquivo ZIP"""
+
+    def __init__(self, diretorio=None, arquivo_zip=None):
+        self.diretorio = diretorio
+        self.zip = zipfile.ZipFile(arquivo_zip, "w") if arquivo_zip else None
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def gravar(self, nome, dados):
+        """Grava um arquivo e retorna o caminho registrado na saída"""
+        if self.zip is not None:
+            # PNG já é comprimido; só vale a pena comprimir o SVG
+            tipo = zipfile.ZIP_DEFLATED if nome.endswith(".svg") else zipfile.ZIP_STORED
+            self.zip.writestr(nome, dados, compress_type=tipo)
+            return nome
+        caminho = os.path.join(self.diretorio, nome)
+        with open(caminho, "wb") as f:
+            f.write(dados)
+        return caminho
+
+    def fechar(self):
+        """Finaliza o arquivo ZIP, se houver"""
+        if self.zip is not None:
+            self.zip.close()
+
+
+def nome_arquivo(numero, txid, extensao):
+    """Nome do arquivo do QR code: número da linha mais o txid sanitizado"""
+    txid = re.sub(r"[^A-Za-z0-9_-]", "_", txid)[:40]
+    return f"{numero:08d}_{txid}.{extensao}"
+
+
+def executar(entrada, saida, formato="jsonl", qr_dir=None, qr_zip=None, formato_qr="png",
+             tamanho_qr=300, tamanho_lote=1000, processos=1, relatorio=sys.stderr, validar_chaves=False,
+             cache_disco=None):
+    """Processa as cobranças de ``entrada`` e escreve os resultados em ``saida``.
+
+    Linhas inválidas não interrompem o processamento: viram um registro com
+    o campo ``erro``. Com ``validar_chaves``, chaves Pix inválidas (CPF ou
+    CNPJ com dígito errado, telefone fora do E.164...) também viram erro em
+    vez de chegar à geração do QR code. Retorna a quantidade de linhas
+    processadas.
+    """
+    formato_qr = formato_qr.lower()
+    destino = DestinoQR(qr_dir, qr_zip) if (qr_dir or qr_zip) else None
+    funcao = partial(processar_bloco, formato_qr=formato_qr if destino else None, tamanho_qr=tamanho_qr,
+                     cache_disco=cache_disco)
+
+    def itens():
+        for numero, linha in enumerate(ler_linhas(entrada, formato), 1):
+            try:
+                argumentos = normalizar(linha)
+            except ValueError as e:
+                yield numero, None, str(e)
+                continue
+            codigo = validar_chave(argumentos[0]) if validar_chaves else OK
+            if codigo != OK:
+                yield numero, None, f"chave Pix inválida: {MENSAGENS_ERRO[codigo]}"
+            else:
+                yield numero, argumentos, None
+
+    inicio = ultimo_relatorio = time.perf_counter()
+    total = 0
+    try:
+        for resultados in mapear_em_blocos(funcao, itens(), tamanho_lote, processos):
+            for registro, imagem in resultados:
+                if imagem is not None:
+                    nome = nome_arquivo(registro["linha"], registro["txid"], formato_qr)
+                    registro["qrcode"] = destino.gravar(nome, imagem)
+                saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            total += len(resultados)
+
+            agora = time.perf_counter()
+            if relatorio and agora - ultimo_relatorio >= INTERVALO_RELATORIO:
+                ultimo_relatorio = agora
+                print(f"{total} linhas ({total / (agora - inicio):,.0f} linhas/s)", file=relatorio)
+    finally:
+        if destino is not None:
+            destino.fechar()
+
+    if relatorio:
+        decorrido = time.perf_counter() - inicio
+        taxa = total / decorrido if decorrido > 0 else 0
+        print(f"Concluído: {total} linhas em {decorrido:.2f}s ({taxa:,.0f} linhas/s)", file=relatorio)
+    return total
+
+
+def criar_parser():
+    """Cria o parser de argumentos da linha de comando"""
+    parser = argparse.ArgumentParser(description="Gera payloads e QR codes Pix em lote, sem interface gráfica.")
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="arquivo CSV ou JSONL com as cobranças (padrão: entrada padrão)")
+    parser.add_argument("-o", "--saida", default="-", help="arquivo JSONL de saída (padrão: saída padrão)")
+    parser.add_argument("-f", "--formato", choices=["csv", "jsonl"],
+                        help="formato da entrada (padrão: pela extensão, ou jsonl)")
+    destino = parser.add_mutually_exclusive_group()
+    destino.add_argument("--qr-dir", help="diretório onde gravar os QR codes")
+    destino.add_argument("--qr-zip", help="arquivo ZIP onde gravar os QR codes")
+    parser.add_argument("--qr-formato", choices=["png", "svg", "pdf"], default="png", help="formato dos QR codes")
+    parser.add_argument("--qr-size", type=int, default=300,
+                        help="tamanho dos QR codes em pixels (em pontos no PDF)")
+    parser.add_argument("--cache-disco", help="arquivo SQLite onde reaproveitar QR codes entre execuções")
+    parser.add_argument("--lote", type=int, default=1000, help="linhas processadas por bloco")
+    parser.add_argument("-j", "--processos", type=int, default=1,
+                        help="processos em paralelo (0 usa todos os núcleos)")
+    parser.add_argument("--validar-chaves", action="store_true",
+                        help="rejeita chaves Pix inválidas (dígitos de CPF/CNPJ, telefone, EVP, e-mail)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="não exibe o relatório de desempenho")
+    return parser
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    args = criar_parser().parse_args(argv)
+    formato = args.formato
+    if formato is None:
+        formato = "csv" if args.entrada.lower().endswith(".csv") else "jsonl"
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8", newline="")
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+    try:
+        executar(entrada, saida, formato, args.qr_dir, args.qr_zip, args.qr_formato, args.qr_size,
+                 args.lote, args.processos or None, None if args.quiet else sys.stderr,
+                 args.validar_chaves, args.cache_disco)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
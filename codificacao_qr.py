@@ -0,0 +1,188 @@
+"""Codificação adaptativa de QR codes: versão mínima prevista e modos por trecho.
+
+O caminho padrão (``qr.gerar_matriz``) sempre parte da versão 1 com
+correção M e deixa o qrcode procurar a versão e dividir os dados com a sua
+heurística. Aqui o payload é dividido de forma ótima em trechos numéricos,
+alfanuméricos e de bytes (programação dinâmica sobre o custo em bits de
+cada modo), a versão mínima sai direto da contagem de bits e o nível de
+correção segue uma ``PoliticaQR`` dada por quem chama.
+
+Chave, txid e URL diferenciam maiúsculas de minúsculas e ficam como estão;
+``payload_alfanumerico`` passa para maiúsculas só o que pode mudar (GUI,
+nome e cidade), o que aumenta os trechos alfanuméricos.
+"""
+from bisect import bisect_left
+from collections import namedtuple
+
+import qrcode
+from qrcode.util import ALPHA_NUM, BIT_LIMIT_TABLE, QRData
+
+from crc16 import crc16_hex
+from decodificador import decodificar_payload
+from template import campo_tlv
+
+NIVEIS = ("L", "M", "Q", "H")  # do menos ao mais redundante
+_CONSTANTES = {"L": qrcode.constants.ERROR_CORRECT_L, "M": qrcode.constants.ERROR_CORRECT_M,
+               "Q": qrcode.constants.ERROR_CORRECT_Q, "H": qrcode.constants.ERROR_CORRECT_H}
+
+NUMERICO, ALFANUMERICO, BYTE = "numerico", "alfanumerico", "byte"
+_MODOS = (NUMERICO, ALFANUMERICO, BYTE)
+_MODOS_QRCODE = {NUMERICO: qrcode.util.MODE_NUMBER, ALFANUMERICO: qrcode.util.MODE_ALPHA_NUM,
+                 BYTE: qrcode.util.MODE_8BIT_BYTE}
+# Bits do contador de caracteres por modo nas versões 1-9, 10-26 e 27-40
+_BITS_CONTADOR = {NUMERICO: (10, 12, 14), ALFANUMERICO: (9, 11, 13), BYTE: (8, 16, 16)}
+_CLASSES = ((1, 9), (10, 26), (27, 40))
+# Custo de cada caractere em sextos de bit (10/3, 11/2 e 8 bits)
+_CUSTO_CARACTERE = {NUMERICO: 20, ALFANUMERICO: 33, BYTE: 48}
+_ALFANUMERICOS = frozenset(ALPHA_NUM)
+_NUMERICOS = frozenset(b"0123456789")
+
+PoliticaQR = namedtuple("PoliticaQR", ("correcao", "elevar", "versao_maxima", "mascara"),
+                        defaults=("M", False, 40, None))
+PoliticaQR.__doc__ = """Política de codificação.
+
+``correcao`` é o nível mínimo (L, M, Q ou H); com ``elevar``, usa o nível
+mais alto que ainda cabe na mesma versão, sem aumentar o símbolo.
+``versao_maxima`` limita o tamanho do símbolo. ``mascara`` fixa a máscara
+(0 a 7) em vez de avaliar as oito, o que corta a maior parte do tempo de
+codificação ao custo de um padrão possivelmente menos equilibrado.
+"""
+
+Codificacao = namedtuple("Codificacao", ("versao", "correcao", "segmentos", "bits"))
+Codificacao.__doc__ = "Parâmetros previstos: versão, nível de correção, trechos ``(modo, bytes)`` e bits de dados"
+
+
+def _classe(versao):
+    return 0 if versao <= 9 else 1 if versao <= 26 else 2
+
+
+def _bits_trecho(modo, tamanho, classe):
+    """Bits de um trecho, com o indicador de modo (4) e o contador de caracteres"""
+    if modo == NUMERICO:
+        dados = 10 * (tamanho // 3) + (0, 4, 7)[tamanho % 3]
+    elif modo == ALFANUMERICO:
+        dados = 11 * (tamanho // 2) + 6 * (tamanho % 2)
+    else:
+        dados = 8 * tamanho
+    return 4 + _BITS_CONTADOR[modo][classe] + dados
+
+
+def bits_segmentos(segmentos, versao=1):
+    """Total de bits de dados dos ``segmentos`` em uma versão"""
+    classe = _classe(versao)
+    return sum(_bits_trecho(modo, len(dados), classe) for modo, dados in segmentos)
+
+
+def segmentar(dados, versao=1):
+    """Divide ``dados`` (str ou bytes) em trechos ``(modo, bytes)`` com o menor total de bits.
+
+    Para cada posição guarda-se o menor custo de terminar em cada modo; a
+    troca de modo paga o cabeçalho do novo trecho, cujo contador depende da
+    faixa de versões.
+    """
+    if isinstance(dados, str):
+        dados = dados.encode("utf-8")
+    if not dados:
+        return []
+    classe = _classe(versao)
+    cabecalhos = [(4 + _BITS_CONTADOR[modo][classe]) * 6 for modo in _MODOS]
+    custos = list(cabecalhos)
+    origens = []  # origens[i][m]: modo do caractere i quando se termina no modo m depois dele
+    infinito = float("inf")
+    for byte in dados:
+        atuais = [infinito, infinito, custos[2] + _CUSTO_CARACTERE[BYTE]]
+        origem = [None, None, 2]
+        if byte in _ALFANUMERICOS:
+            atuais[1] = custos[1] + _CUSTO_CARACTERE[ALFANUMERICO]
+            origem[1] = 1
+            if byte in _NUMERICOS:
+                atuais[0] = custos[0] + _CUSTO_CARACTERE[NUMERICO]
+                origem[0] = 0
+        # Trocar de modo depois deste caractere: fecha o trecho em bits inteiros e abre outro
+        for destino in range(3):
+            for anterior in range(3):
+                if origem[anterior] is None:
+                    continue
+                custo = -(-atuais[anterior] // 6) * 6 + cabecalhos[destino]
+                if custo < atuais[destino]:
+                    atuais[destino] = custo
+                    origem[destino] = anterior
+        origens.append(origem)
+        custos = atuais
+
+    modo = min(range(3), key=custos.__getitem__)
+    modos = bytearray(len(dados))
+    for i in range(len(dados) - 1, -1, -1):
+        modo = origens[i][modo]
+        modos[i] = modo
+
+    segmentos = []
+    inicio = 0
+    for i in range(1, len(dados) + 1):
+        if i == len(dados) or modos[i] != modos[inicio]:
+            segmentos.append((_MODOS[modos[inicio]], dados[inicio:i]))
+            inicio = i
+    return segmentos
+
+
+def prever(payload, politica=PoliticaQR()):
+    """Prevê versão, nível de correção e trechos do QR code de ``payload`` sem montá-lo.
+
+    Levanta ``ValueError`` se o payload não couber em ``politica.versao_maxima``.
+    """
+    limites = BIT_LIMIT_TABLE[_CONSTANTES[politica.correcao]]
+    for primeira, ultima in _CLASSES:
+        segmentos = segmentar(payload, primeira)
+        bits = bits_segmentos(segmentos, primeira)
+        versao = bisect_left(limites, bits, primeira)
+        if versao <= ultima:
+            break
+    if versao > min(politica.versao_maxima, 40):
+        raise ValueError(f"o payload precisa de {bits} bits e não cabe até a versão {politica.versao_maxima} "
+                         f"com correção {politica.correcao}")
+
+    correcao = politica.correcao
+    if politica.elevar:
+        for nivel in NIVEIS[NIVEIS.index(correcao) + 1:]:
+            if BIT_LIMIT_TABLE[_CONSTANTES[nivel]][versao] < bits:
+                break
+            correcao = nivel
+    return Codificacao(versao, correcao, segmentos, bits)
+
+
+def codificar(payload, politica=PoliticaQR(), borda=4):
+    """Monta o ``qrcode.QRCode`` com os parâmetros previstos, sem a busca de versão do qrcode"""
+    codificacao = prever(payload, politica)
+    codigo = qrcode.QRCode(
+        version=codificacao.versao,
+        error_correction=_CONSTANTES[codificacao.correcao],
+        box_size=10,
+        border=borda,
+        mask_pattern=politica.mascara,
+    )
+    for modo, dados in codificacao.segmentos:
+        codigo.add_data(QRData(dados, _MODOS_QRCODE[modo], check_data=False))
+    codigo.make(fit=False)
+    return codigo
+
+
+def gerar_matriz(payload, politica=PoliticaQR()):
+    """Matriz de módulos (com a quiet zone) no mesmo formato de ``qr.gerar_matriz``"""
+    return codificar(payload, politica).get_matrix()
+
+
+def payload_alfanumerico(payload):
+    """Retorna o payload com GUI, nome (59) e cidade (60) em maiúsculas e o CRC recalculado.
+
+    Os demais campos não mudam. O resultado é outro payload: use o mesmo
+    texto no QR code e no copia e cola.
+    """
+    partes = []
+    for id_campo, valor in decodificar_payload(payload, estrito=False).campos[:-1]:
+        if id_campo in ("59", "60"):
+            valor = valor.upper()
+        elif id_campo == "26" and valor[:4] == "0014" and valor[4:18].upper() == "BR.GOV.BCB.PIX":
+            valor = valor[:4] + "BR.GOV.BCB.PIX" + valor[18:]
+        partes.append(campo_tlv(id_campo, valor))
+    sem_crc = "".join(partes) + "6304"
+    return sem_crc + crc16_hex(sem_crc)
@@ -0,0 +1,208 @@
+"""Varredura de arquivos grandes em busca de payloads Pix (BRCode) para conciliação.
+
+O arquivo é mapeado em memória (mmap) e percorrido em trechos: em cada um,
+``mmap.find`` localiza os inícios ``000201``, a estrutura TLV do candidato é
+seguida até o campo 63 e só então o trecho vira bytes e passa por
+``decodificar_payload``, que confere o CRC. Os trechos podem ser distribuídos
+entre processos; um payload que começa perto do fim de um trecho é lido além
+do limite e o trecho seguinte retoma a varredura depois dele, então o
+resultado (inclusive a contagem de rejeitados) não depende do tamanho dos
+trechos.
+
+Uso: python conciliacao.py extrato.txt [outro.log ...] [-o pagamentos.jsonl] [-j 0]
+"""
+import argparse
+import json
+import mmap
+import os
+import sys
+import time
+
+from decodificador import PayloadInvalido, decodificar_payload
+from lote import mapear_em_blocos
+
+INICIO = b"000201"
+MAX_PAYLOAD = 512  # tamanho máximo de um BRCode
+TAMANHO_TRECHO = 16 * 1024 * 1024
+
+
+def _fim_candidato(dados, inicio, limite):
+    """Segue os cabeçalhos TLV a partir de ``inicio`` e retorna o fim do campo 63, ou None"""
+    i = inicio
+    while i + 4 <= limite:
+        cabecalho = dados[i:i + 4]
+        if not cabecalho.isdigit():
+            return None
+        final = i + 4 + int(cabecalho[2:])
+        if cabecalho[:2] == b"63":
+            return final if cabecalho[2:] == b"04" and final <= limite else None
+        i = final
+    return None
+
+
+def _payload_em(dados, posicao):
+    """Retorna ``(final, payload, PayloadPix)`` do payload válido que começa em ``posicao``, ou None"""
+    final = _fim_candidato(dados, posicao, min(posicao + MAX_PAYLOAD, len(dados)))
+    if final is None:
+        return None
+    payload = dados[posicao:final]
+    try:
+        return final, payload, decodificar_payload(payload)
+    except PayloadInvalido:
+        return None
+
+
+def _cruza(dados, limite):
+    """Diz se algum payload válido começa antes de ``limite`` e termina depois dele"""
+    fim = limite + len(INICIO) - 1
+    posicao = dados.find(INICIO, max(limite - MAX_PAYLOAD, 0), fim)
+    while posicao >= 0:
+        encontrado = _payload_em(dados, posicao)
+        if encontrado is not None and encontrado[0] > limite:
+            return True
+        posicao = dados.find(INICIO, posicao + 1, fim)
+    return False
+
+
+def _retomar(dados, inicio):
+    """Posição em que a varredura do buffer inteiro, feita de uma vez, continuaria a partir de ``inicio``.
+
+    Se um payload válido cruza ``inicio``, ele pertence ao trecho anterior e
+    os candidatos dentro dele não são vistos. Volta-se ``MAX_PAYLOAD`` bytes
+    por vez até um ponto que nenhum payload válido cruza e a varredura é
+    refeita dali até ``inicio``.
+    """
+    recomeco = inicio
+    while recomeco > 0 and _cruza(dados, recomeco):
+        recomeco = max(recomeco - MAX_PAYLOAD, 0)
+    fim = inicio + len(INICIO) - 1
+    posicao = dados.find(INICIO, recomeco, fim)
+    while posicao >= 0:
+        encontrado = _payload_em(dados, posicao)
+        proxima = posicao + 1 if encontrado is None else encontrado[0]
+        if proxima > inicio:
+            return proxima
+        posicao = dados.find(INICIO, proxima, fim)
+    return inicio
+
+
+def varrer(dados, inicio=0, fim=None):
+    """Procura payloads Pix que comecem entre ``inicio`` e ``fim`` em um buffer (mmap ou bytes).
+
+    Retorna ``(registros, rejeitados)``: ``registros`` é uma lista de
+    ``(posicao, payload, PayloadPix)`` com CRC conferido e ``rejeitados`` o
+    número de candidatos com estrutura ou CRC inválidos. Um payload pode
+    terminar até ``MAX_PAYLOAD`` bytes depois de ``fim``, e os candidatos
+    dentro de um payload que vem do trecho anterior são ignorados; assim a
+    soma dos trechos é igual à varredura do buffer inteiro de uma vez.
+    """
+    tamanho = len(dados)
+    # find só encontra ocorrências inteiras dentro do intervalo; estende-se o
+    # fim para achar também um "000201" que comece no trecho e cruze o limite
+    fim = tamanho if fim is None else min(fim + len(INICIO) - 1, tamanho)
+    registros = []
+    rejeitados = 0
+    posicao = dados.find(INICIO, _retomar(dados, inicio) if inicio else 0, fim)
+    while posicao >= 0:
+        encontrado = _payload_em(dados, posicao)
+        if encontrado is None:
+            rejeitados += 1
+            proxima = posicao + 1
+        else:
+            proxima, payload, pix = encontrado
+            registros.append((posicao, payload.decode("ascii"), pix))
+        posicao = dados.find(INICIO, proxima, fim)
+    return registros, rejeitados
+
+
+def varrer_trechos(trechos):
+    """Varre uma lista de ``(caminho, inicio, fim)``; executado nos processos do pool"""
+    resultados = []
+    for caminho, inicio, fim in trechos:
+        with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+            registros, rejeitados = varrer(dados, inicio, fim)
+        resultados.append((caminho, fim - inicio, registros, rejeitados))
+    return resultados
+
+
+def dividir(caminhos, tamanho_trecho=TAMANHO_TRECHO):
+    """Divide os arquivos em trechos ``(caminho, inicio, fim)`` de até ``tamanho_trecho`` bytes"""
+    for caminho in caminhos:
+        tamanho = os.path.getsize(caminho)
+        for inicio in range(0, tamanho, tamanho_trecho):
+            yield caminho, inicio, min(inicio + tamanho_trecho, tamanho)
+
+
+def conciliar(caminhos, processos=1, tamanho_trecho=TAMANHO_TRECHO, estatisticas=None):
+    """Gera ``(caminho, posicao, payload, PayloadPix)`` para cada payload válido nos arquivos.
+
+    Os resultados saem na ordem dos arquivos e das posições. Com
+    ``processos`` diferente de 1 os trechos são varridos em paralelo
+    (``None`` usa todos os núcleos), com no máximo dois trechos por processo
+    em trânsito. Se ``estatisticas`` for um dict, recebe ``bytes``,
+    ``payloads`` e ``rejeitados`` ao longo da varredura.
+    """
+    if estatisticas is None:
+        estatisticas = {}
+    for chave in ("bytes", "payloads", "rejeitados"):
+        estatisticas.setdefault(chave, 0)
+    for resultados in mapear_em_blocos(varrer_trechos, dividir(caminhos, tamanho_trecho), 1, processos):
+        for caminho, lidos, registros, rejeitados in resultados:
+            estatisticas["bytes"] += lidos
+            estatisticas["payloads"] += len(registros)
+            estatisticas["rejeitados"] += rejeitados
+            for posicao, payload, pix in registros:
+                yield caminho, posicao, payload, pix
+
+
+def registro(caminho, posicao, payload, pix):
+    """Monta o registro JSON de saída de um payload encontrado"""
+    return {
+        "arquivo": caminho,
+        "posicao": posicao,
+        "chave": pix.chave,
+        "valor": pix.valor,
+        "txid": pix.txid,
+        "nome": pix.nome,
+        "cidade": pix.cidade,
+        "url": pix.url,
+        "payload": payload,
+    }
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Encontra e decodifica payloads Pix em arquivos grandes.")
+    parser.add_argument("arquivos", nargs="+", help="arquivos a varrer (extratos, logs...)")
+    parser.add_argument("-o", "--saida", default="-", help="arquivo JSONL de saída (padrão: saída padrão)")
+    parser.add_argument("-j", "--processos", type=int, default=1,
+                        help="processos em paralelo (0 usa todos os núcleos)")
+    parser.add_argument("--trecho", type=int, default=TAMANHO_TRECHO // (1024 * 1024),
+                        help="tamanho de cada trecho varrido, em MiB")
+    parser.add_argument("-q", "--quiet", action="store_true", help="não exibe o relatório de desempenho")
+    args = parser.parse_args(argv)
+    if args.trecho < 1:
+        parser.error("--trecho deve ser pelo menos 1")
+
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+    estatisticas = {}
+    inicio = time.perf_counter()
+    try:
+        for encontrado in conciliar(args.arquivos, args.processos or None, args.trecho * 1024 * 1024,
+                                    estatisticas):
+            saida.write(json.dumps(registro(*encontrado), ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    if not args.quiet:
+        decorrido = time.perf_counter() - inicio
+        mib = estatisticas["bytes"] / (1024 * 1024)
+        taxa = mib / decorrido if decorrido > 0 else 0
+        print(f"Concluído: {estatisticas['payloads']} payloads válidos, {estatisticas['rejeitados']} "
+              f"candidatos rejeitados, {mib:,.1f} MiB em {decorrido:.2f}s ({taxa:,.1f} MiB/s)",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Decodificação e validação de payloads Pix (BRCode) em uma única passada."""
+from binascii import crc_hqx
+from collections import namedtuple
+
+from crc16 import CRC_INICIAL
+
+NOMES_CAMPOS = {
+    "00": "Payload Format Indicator",
+    "01": "Point of Initiation Method",
+    "26": "Merchant Account Information",
+    "52": "Merchant Category Code",
+    "53": "Transaction Currency",
+    "54": "Transaction Amount",
+    "58": "Country Code",
+    "59": "Merchant Name",
+    "60": "Merchant City",
+    "61": "Postal Code",
+    "62": "Additional Data Field",
+    "63": "CRC",
+}
+
+_ATRIBUTOS = ("campos", "formato", "metodo_iniciacao", "gui", "chave", "info_adicional", "url",
+              "categoria", "moeda", "valor", "pais", "nome", "cidade", "cep", "txid", "crc",
+              "crc_valido")
+_INDICE = {atributo: i for i, atributo in enumerate(_ATRIBUTOS)}
+
+# Posição em PayloadPix de cada campo de nível superior e dos subcampos dos templates 26 e 62
+_CAMPOS = {
+    "00": _INDICE["formato"], "01": _INDICE["metodo_iniciacao"], "52": _INDICE["categoria"],
+    "53": _INDICE["moeda"], "54": _INDICE["valor"], "58": _INDICE["pais"], "59": _INDICE["nome"],
+    "60": _INDICE["cidade"], "61": _INDICE["cep"],
+}
+_SUBCAMPOS = {
+    "26": {"00": _INDICE["gui"], "01": _INDICE["chave"], "02": _INDICE["info_adicional"],
+           "25": _INDICE["url"]},
+    "62": {"05": _INDICE["txid"]},
+}
+
+
+class PayloadInvalido(ValueError):
+    """Payload malformado ou com CRC incorreto; ``posicao`` indica o caractere do problema"""
+
+    def __init__(self, mensagem, posicao=None):
+        if posicao is not None:
+            mensagem = f"{mensagem} (posição {posicao})"
+        super().__init__(mensagem)
+        self.posicao = posicao
+
+
+class PayloadPix(namedtuple("PayloadPix", _ATRIBUTOS)):
+    """Resultado compacto (uma tupla, sem ``__dict__``) da decodificação de um payload Pix.
+
+    Os campos de nível superior ficam em ``campos`` (pares id/valor, na
+    ordem do payload); os mais usados, inclusive os subcampos dos templates
+    26 (GUI, chave, URL) e 62 (txid), também ficam em atributos próprios.
+    """
+
+    __slots__ = ()
+
+    def as_dict(self):
+        """Campos de nível superior como dict, no formato de GeradorPix.parse_payload"""
+        return dict(self.campos)
+
+    def __repr__(self):
+        return f"PayloadPix(chave={self.chave!r}, valor={self.valor!r}, txid={self.txid!r}, crc={self.crc!r})"
+
+
+# Tamanho (e validade) de cada par de dígitos de um cabeçalho TLV: uma consulta substitui isdigit + int
+_DOIS_DIGITOS = {f"{n:02d}": n for n in range(100)}
+
+
+def _texto(dados):
+    """Retorna o payload como str ASCII; bytes são decodificados uma única vez"""
+    if isinstance(dados, str):
+        if not dados.isascii():
+            raise PayloadInvalido("o payload deve conter apenas caracteres ASCII")
+        return dados
+    try:
+        return str(dados, "ascii")
+    except UnicodeDecodeError as e:
+        raise PayloadInvalido("o payload deve conter apenas caracteres ASCII", e.start)
+
+
+def _cabecalho_invalido(texto, i, fim):
+    """Erro de um cabeçalho ID + tamanho que não passou na validação"""
+    if i + 4 > fim:
+        return PayloadInvalido("campo truncado", i)
+    return PayloadInvalido(f"cabeçalho de campo inválido {texto[i:i + 4]!r}", i)
+
+
+def decodificar_payload(dados, estrito=True):
+    """Decodifica e valida um payload Pix (str, bytes, bytearray ou memoryview).
+
+    A estrutura TLV é percorrida uma única vez, descendo nos templates 26 e
+    62; o CRC (campo 63, obrigatoriamente o último) é conferido no mesmo
+    passo, sobre o buffer original quando a entrada já é binária. Erros de
+    estrutura sempre levantam ``PayloadInvalido``; um CRC incorreto só
+    levanta se ``estrito`` for verdadeiro, senão fica registrado em
+    ``crc_valido``.
+    """
+    texto = _texto(dados)
+    fim = len(texto)
+    if fim and texto[:2] != "00":
+        raise PayloadInvalido("o payload deve começar pelo campo 00", 0)
+    dois_digitos = _DOIS_DIGITOS
+    indices = _CAMPOS
+    valores = [None] * len(_ATRIBUTOS)
+    campos = []
+    adicionar = campos.append
+    i = 0
+    while i < fim:
+        id_campo = texto[i:i + 2]
+        tamanho = dois_digitos.get(texto[i + 2:i + 4])
+        if tamanho is None or id_campo not in dois_digitos:
+            raise _cabecalho_invalido(texto, i, fim)
+        inicio = i + 4
+        final = inicio + tamanho
+        if final > fim:
+            raise PayloadInvalido(f"campo {id_campo} ultrapassa o fim do payload", i)
+        valor = texto[inicio:final]
+        adicionar((id_campo, valor))
+        indice = indices.get(id_campo)
+        if indice is not None:
+            valores[indice] = valor
+        elif id_campo in _SUBCAMPOS:
+            subcampos = _SUBCAMPOS[id_campo]
+            j = inicio
+            while j < final:
+                id_subcampo = texto[j:j + 2]
+                tamanho = dois_digitos.get(texto[j + 2:j + 4])
+                if tamanho is None or id_subcampo not in dois_digitos or j + 4 > final:
+                    raise _cabecalho_invalido(texto, j, final)
+                final_subcampo = j + 4 + tamanho
+                if final_subcampo > final:
+                    raise PayloadInvalido(f"campo {id_subcampo} ultrapassa o fim do payload", j)
+                indice = subcampos.get(id_subcampo)
+                if indice is not None:
+                    valores[indice] = texto[j + 4:final_subcampo]
+                j = final_subcampo
+        elif id_campo == "63":
+            if tamanho != 4 or final != fim:
+                raise PayloadInvalido("o campo 63 (CRC) deve ser o último e ter 4 caracteres", i)
+            prefixo = texto[:inicio].encode("ascii") if dados is texto else memoryview(dados)[:inicio]
+            esperado = "%04X" % crc_hqx(prefixo, CRC_INICIAL)
+            crc_valido = valor.upper() == esperado
+            if estrito and not crc_valido:
+                raise PayloadInvalido(f"CRC incorreto: {valor}, esperado {esperado}", inicio)
+            valores[-2] = valor
+            valores[-1] = crc_valido
+        i = final
+
+    if valores[-2] is None:
+        raise PayloadInvalido("campo 63 (CRC) ausente", fim)
+    valores[0] = tuple(campos)
+    return PayloadPix._make(valores)
+
+
+def campos_payload(dados):
+    """Campos de nível superior de um payload como dict, sem descer nos templates nem conferir o CRC.
+
+    Caminho rápido de ``GeradorPix.parse_payload``: a estrutura TLV de
+    nível superior é validada como em ``decodificar_payload`` (inclusive o
+    campo 63 como último), mas o conteúdo dos templates e o valor do CRC não.
+    """
+    texto = _texto(dados)
+    fim = len(texto)
+    if fim and texto[:2] != "00":
+        raise PayloadInvalido("o payload deve começar pelo campo 00", 0)
+    dois_digitos = _DOIS_DIGITOS
+    campos = {}
+    i = 0
+    while i < fim:
+        id_campo = texto[i:i + 2]
+        tamanho = dois_digitos.get(texto[i + 2:i + 4])
+        if tamanho is None or id_campo not in dois_digitos:
+            raise _cabecalho_invalido(texto, i, fim)
+        final = i + 4 + tamanho
+        if final > fim:
+            raise PayloadInvalido(f"campo {id_campo} ultrapassa o fim do payload", i)
+        campos[id_campo] = texto[i + 4:final]
+        i = final
+    if "63" not in campos:
+        raise PayloadInvalido("campo 63 (CRC) ausente", fim)
+    if id_campo != "63" or tamanho != 4:
+        raise PayloadInvalido("o campo 63 (CRC) deve ser o último e ter 4 caracteres", fim)
+    return campos
+
+
+def decodificar_lote(payloads, estrito=True):
+    """Decodifica vários payloads, sem interromper nos inválidos.
+
+    Gera uma tupla ``(indice, resultado, erro)`` por payload: ``resultado``
+    é um ``PayloadPix`` ou ``None`` e ``erro`` é o ``PayloadInvalido``
+    correspondente ou ``None``.
+    """
+    for indice, payload in enumerate(payloads):
+        try:
+            yield indice, decodificar_payload(payload, estrito), None
+        except PayloadInvalido as e:
+            yield indice, None, e
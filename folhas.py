@@ -0,0 +1,159 @@
+"""Folhas de impressão em PDF com muitos QR codes Pix por página.
+
+Recebe um fluxo de payloads (de ``GeradorPix.gerar_payload`` ou da saída do
+``cli.py``) e os distribui em uma grade configurável, cada QR code com uma
+legenda de valor, txid e recebedor. As páginas são desenhadas em vetores,
+podem ser renderizadas em vários processos e vão sendo gravadas no arquivo
+assim que ficam prontas, então a memória usada não cresce com o número de
+páginas.
+
+Uso: python folhas.py payloads.jsonl -o folhas.pdf [--colunas 3 --linhas 4] [-j 0]
+"""
+import argparse
+import json
+import sys
+import time
+import zlib
+from collections import namedtuple
+from functools import partial
+
+from decodificador import PayloadInvalido, decodificar_payload
+from lote import mapear_em_blocos
+from pdf import EscritorPDF, texto_pdf
+
+# Tamanhos de página em pontos (1/72 de polegada)
+PAGINAS = {"a4": (595.28, 841.89), "carta": (612.0, 792.0)}
+
+Grade = namedtuple("Grade", ("colunas", "linhas", "largura", "altura", "margem", "fonte"),
+                   defaults=(3, 4) + PAGINAS["a4"] + (36.0, 8.0))
+Grade.__doc__ = "Disposição da folha: grade de QR codes, página e margem em pontos e corpo da legenda"
+
+BORDA_QR = 4  # módulos de margem (quiet zone) incluídos na matriz do QR code
+
+
+def legendas(payload):
+    """Linhas da legenda de um payload: valor, txid e nome do recebedor"""
+    try:
+        pix = decodificar_payload(payload, estrito=False)
+    except PayloadInvalido:
+        return ["payload inválido"]
+    valor = f"R$ {pix.valor.replace('.', ',')}" if pix.valor else "Valor livre"
+    return [valor, f"txid: {pix.txid or '***'}", pix.nome or ""]
+
+
+def _cortar(texto, limite):
+    return texto if len(texto) <= limite else texto[:max(limite - 1, 0)] + "…"
+
+
+def renderizar_pagina(payloads, grade):
+    """Desenha uma página com até ``colunas * linhas`` QR codes e retorna o conteúdo já comprimido"""
+    import qr
+
+    largura_celula = (grade.largura - 2 * grade.margem) / grade.colunas
+    altura_celula = (grade.altura - 2 * grade.margem) / grade.linhas
+    entrelinha = grade.fonte * 1.25
+    # Três linhas de legenda e a descida da última ficam fora do QR code da linha de baixo
+    lado = min(largura_celula, altura_celula - 3 * entrelinha - grade.fonte * 0.3)
+    if lado <= 0:
+        raise ValueError("a grade não cabe na página: reduza colunas, linhas, margem ou fonte")
+
+    operadores = []
+    for indice, payload in enumerate(payloads):
+        coluna, linha = indice % grade.colunas, indice // grade.colunas
+        matriz = qr.gerar_matriz(payload)
+        borda = BORDA_QR * lado / len(matriz)
+        x = grade.margem + coluna * largura_celula + (largura_celula - lado) / 2
+        y = grade.altura - grade.margem - linha * altura_celula - lado
+        operadores.append(qr.pdf_operadores(matriz, x, y, lado))
+
+        # A legenda começa em y, abaixo da quiet zone (o ' desce uma linha antes de escrever),
+        # alinhada à esquerda do QR code visível
+        limite = int((lado - 2 * borda) / (grade.fonte * 0.55))
+        texto = [b"BT /F1 %.1f Tf %.1f TL %.2f %.2f Td" % (grade.fonte, entrelinha, x + borda, y)]
+        texto.extend(texto_pdf(_cortar(linha_legenda, limite)) + b" '" for linha_legenda in legendas(payload))
+        texto.append(b"ET\n")
+        operadores.append(b" ".join(texto))
+    return zlib.compress(b"".join(operadores), 6)
+
+
+def compor_folhas(payloads, arquivo, grade=Grade(), processos=1):
+    """Grava em ``arquivo`` (binário) o PDF com os ``payloads`` e retorna o número de páginas.
+
+    Com ``processos`` diferente de 1 as páginas são renderizadas em
+    paralelo (``None`` usa todos os núcleos), no máximo duas por processo em
+    trânsito; cada página é gravada assim que fica pronta, na ordem.
+    """
+    pdf = EscritorPDF(arquivo)
+    catalogo, arvore, fonte = pdf.reservar(), pdf.reservar(), pdf.reservar()
+    pdf.objeto(fonte, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    recursos = b"<< /Font << /F1 %d 0 R >> >>" % fonte
+    caixa = b"[0 0 %.2f %.2f]" % (grade.largura, grade.altura)
+
+    paginas = []
+    renderizar = partial(renderizar_pagina, grade=grade)
+    for conteudo in mapear_em_blocos(renderizar, payloads, grade.colunas * grade.linhas, processos):
+        pagina, fluxo = pdf.reservar(), pdf.reservar()
+        pdf.objeto(pagina, b"<< /Type /Page /Parent %d 0 R /MediaBox %s /Contents %d 0 R /Resources %s >>"
+                   % (arvore, caixa, fluxo, recursos))
+        pdf.fluxo(fluxo, conteudo, comprimido=True)
+        paginas.append(pagina)
+
+    filhos = b" ".join(b"%d 0 R" % pagina for pagina in paginas)
+    pdf.objeto(arvore, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (filhos, len(paginas)))
+    pdf.objeto(catalogo, b"<< /Type /Catalog /Pages %d 0 R >>" % arvore)
+    pdf.fechar(catalogo)
+    return len(paginas)
+
+
+def ler_payloads(arquivo):
+    """Lê um payload por linha; aceita também o JSONL do ``cli.py`` (linhas com erro são ignoradas)"""
+    for linha in arquivo:
+        linha = linha.strip()
+        if not linha:
+            continue
+        if linha.startswith("{"):
+            payload = json.loads(linha).get("payload")
+            if payload:
+                yield payload
+        else:
+            yield linha
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Compõe folhas de impressão em PDF com QR codes Pix.")
+    parser.add_argument("entrada", nargs="?", default="-",
+                        help="arquivo com um payload por linha ou JSONL do cli.py (padrão: entrada padrão)")
+    parser.add_argument("-o", "--saida", default="-", help="arquivo PDF de saída (padrão: saída padrão)")
+    parser.add_argument("--colunas", type=int, default=3, help="QR codes por linha da grade")
+    parser.add_argument("--linhas", type=int, default=4, help="linhas da grade por página")
+    parser.add_argument("--pagina", choices=sorted(PAGINAS), default="a4", help="tamanho da página")
+    parser.add_argument("--margem", type=float, default=36.0, help="margem da página em pontos")
+    parser.add_argument("--fonte", type=float, default=8.0, help="corpo da legenda em pontos")
+    parser.add_argument("-j", "--processos", type=int, default=1,
+                        help="processos em paralelo (0 usa todos os núcleos)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="não exibe o relatório de desempenho")
+    args = parser.parse_args(argv)
+    if args.colunas < 1 or args.linhas < 1:
+        parser.error("--colunas e --linhas devem ser pelo menos 1")
+
+    grade = Grade(args.colunas, args.linhas, *PAGINAS[args.pagina], args.margem, args.fonte)
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    saida = sys.stdout.buffer if args.saida == "-" else open(args.saida, "wb")
+    inicio = time.perf_counter()
+    try:
+        total = compor_folhas(ler_payloads(entrada), saida, grade, args.processos or None)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout.buffer:
+            saida.close()
+
+    if not args.quiet:
+        decorrido = time.perf_counter() - inicio
+        taxa = total / decorrido if decorrido > 0 else 0
+        print(f"Concluído: {total} páginas em {decorrido:.2f}s ({taxa:,.1f} páginas/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
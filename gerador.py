@@ -0,0 +1,114 @@
+"""Núcleo do Gerador Pix: montagem do payload EMV (BRCode) e CRC16.
+
+Este módulo não importa PyQt6, qrcode nem Pillow; essas dependências só são
+carregadas quando um QR code é de fato gerado.
+"""
+import os
+
+from cache_qr import FORMATOS, cache_padrao
+from crc16 import crc16_hex
+from decodificador import campos_payload
+from metricas import SEM_MEDICAO
+from template import CamposPayload, PayloadTemplate
+
+class GeradorPix:
+    """Classe responsável pela geração de payloads PIX e QR codes.
+
+    Não guarda estado entre chamadas: uma mesma instância pode ser usada
+    por várias threads ao mesmo tempo (o cache de QR codes e as métricas
+    são thread-safe).
+    """
+    
+    def __init__(self, cache_qr=None, metricas=None):
+        self.cache_qr = cache_qr if cache_qr is not None else cache_padrao
+        self.metricas = metricas  # metricas.Metricas para instrumentar os métodos, ou None
+        
+    def calculate_crc16(self, data):
+        """Calcula o CRC16/CCITT-FALSE do payload (str, bytes ou memoryview)"""
+        return crc16_hex(data)
+
+    def _medir(self, metodo, etapas):
+        """Contexto que mede ``metodo`` nas métricas, ou ``SEM_MEDICAO`` se não houver métricas"""
+        metricas = self.metricas
+        return SEM_MEDICAO if metricas is None else metricas.medir(metodo, etapas)
+
+    def gerar_payload(self, chave_pix, valor=None, txid="***", nome_merchant="N", cidade_merchant="C"):
+        """Gera o payload do PIX com os campos necessários"""
+        with self._medir("gerar_payload", ("tlv", "crc")) as medicao:
+            payload_sem_crc = CamposPayload.montar(chave_pix, valor, txid, nome_merchant, cidade_merchant).sem_crc()
+            medicao.marca()
+            return payload_sem_crc + self.calculate_crc16(payload_sem_crc)
+    
+    def gerar_payload_dinamico(self, url, valor=None, nome_merchant="N", cidade_merchant="C", unico=True):
+        """Gera o payload de um Pix dinâmico a partir da URL de location criada no PSP"""
+        with self._medir("gerar_payload_dinamico", ("tlv", "crc")) as medicao:
+            payload_sem_crc = CamposPayload.montar_dinamico(url, valor, nome_merchant, cidade_merchant, unico).sem_crc()
+            medicao.marca()
+            return payload_sem_crc + self.calculate_crc16(payload_sem_crc)
+
+    def compilar_template(self, chave_pix, nome_merchant="N", cidade_merchant="C"):
+        """Pré-compila os campos fixos do recebedor para gerar payloads em série"""
+        return PayloadTemplate(chave_pix, nome_merchant, cidade_merchant)
+    
+    def gerar_qrcode_pillow(self, payload, size=300):
+        """Gera um QR code usando Pillow"""
+        import qr
+        with self._medir("gerar_qrcode_pillow", ("matriz", "imagem")) as medicao:
+            matriz = self.cache_qr.matriz(payload)
+            medicao.marca()
+            return qr.renderizar_matriz(matriz, size)
+    
+    def gerar_qrcode_qimage(self, payload, size=300):
+        """Gera um QR code como QImage 1-bit sobre os pixels já empacotados.
+
+        Ao contrário do QPixmap, o QImage pode ser criado fora da thread da
+        interface gráfica.
+        """
+        from PyQt6.QtGui import QImage
+        with self._medir("gerar_qrcode_qimage", ("pixels", "qimage")) as medicao:
+            dados, bytes_linha = self.cache_qr.pixels(payload, size)
+            medicao.marca()
+            imagem = QImage(dados, size, size, bytes_linha, QImage.Format.Format_Mono)
+            imagem.setColorTable([0xFF000000, 0xFFFFFFFF])  # bit 0 = preto, bit 1 = branco
+            return imagem
+    
+    def gerar_qrcode_pixmap(self, payload, size=300):
+        """Gera um QR code e retorna como QPixmap, sem passar por PNG"""
+        from PyQt6.QtGui import QPixmap
+        with self._medir("gerar_qrcode_pixmap", ("qimage", "pixmap")) as medicao:
+            imagem = self.gerar_qrcode_qimage(payload, size)
+            medicao.marca()
+            return QPixmap.fromImage(imagem)
+    
+    def salvar_qrcode(self, payload, filename, size=300):
+        """Salva o QR code no formato indicado pela extensão (PNG, SVG, PDF, JPEG...).
+
+        SVG e PDF são vetoriais e PNG sai em 1 bit por pixel, tudo gerado
+        direto da matriz de módulos; ``size`` é o lado em pixels (em pontos
+        no PDF). As demais extensões passam pelo Pillow.
+        """
+        try:
+            with self._medir("salvar_qrcode", ("codificacao", "escrita")) as medicao:
+                formato = FORMATOS.get(os.path.splitext(filename)[1].lower())
+                if formato is None:
+                    imagem = self.gerar_qrcode_pillow(payload, size)
+                    medicao.marca()
+                    imagem.save(filename)
+                else:
+                    dados = self.cache_qr.imagem(payload, size, formato)
+                    medicao.marca()
+                    with open(filename, "wb") as f:
+                        f.write(dados)
+            return True
+        except Exception as e:
+            print(f"Erro ao salvar QR code: {e}")
+            return False
+
+    def parse_payload(self, payload):
+        """Analisa um payload PIX e extrai seus campos de nível superior.
+
+        Levanta ``PayloadInvalido`` se a estrutura de nível superior estiver
+        corrompida; para o resultado completo, com subcampos e verificação do
+        CRC, use ``decodificador.decodificar_payload``.
+        """
+        return campos_payload(payload)
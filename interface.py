@@ -0,0 +1,507 @@
+"""Interface gráfica (PyQt6) do Gerador Pix."""
+import os
+from decimal import Decimal
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+                            QLabel, QLineEdit, QPushButton, QTextEdit, QGroupBox, QFileDialog, 
+                            QMessageBox, QSpinBox, QComboBox, QFormLayout, QSplitter, QCheckBox)
+from PyQt6.QtGui import QPixmap, QFont
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from decodificador import NOMES_CAMPOS
+from gerador import GeradorPix
+from validacao import OK, validar_chave
+
+class SinaisGeracao(QObject):
+    """Sinais emitidos por uma TarefaGeracao (QRunnable não é um QObject)"""
+    concluida = pyqtSignal(int, object)
+    falhou = pyqtSignal(int, str)
+
+class TarefaGeracao(QRunnable):
+    """Gera payload, QR code e campos decodificados fora da thread da interface.
+
+    A tarefa consulta ``ativa(id_tarefa)`` entre as etapas e desiste assim que
+    uma geração mais recente a substitui. O resultado volta como um QImage,
+    que é convertido em QPixmap na thread da interface.
+    """
+    
+    def __init__(self, id_tarefa, dados, cache_qr, ativa):
+        super().__init__()
+        self.id_tarefa = id_tarefa
+        self.dados = dados
+        self.cache_qr = cache_qr
+        self.ativa = ativa
+        self.sinais = SinaisGeracao()
+
+    def run(self):
+        """Executa a geração na thread do QThreadPool"""
+        if not self.ativa(self.id_tarefa):
+            return
+        dados = self.dados
+        try:
+            gerador = GeradorPix(self.cache_qr)
+            payload = gerador.gerar_payload(dados["chave"], dados["valor"], dados["txid"],
+                                            dados["nome"], dados["cidade"])
+            if not self.ativa(self.id_tarefa):
+                return
+            imagem = gerador.gerar_qrcode_qimage(payload, dados["qr_size"])
+            parsed = gerador.parse_payload(payload)
+        except ValueError as e:
+            self.sinais.falhou.emit(self.id_tarefa, f"Erro de valor: {str(e)}")
+            return
+        except Exception as e:
+            self.sinais.falhou.emit(self.id_tarefa, f"Erro ao gerar PIX: {str(e)}")
+            return
+        self.sinais.concluida.emit(self.id_tarefa, (payload, imagem, parsed))
+
+class PixGUI(QMainWindow):
+    """Interface gráfica para o Gerador PIX"""
+    
+    def __init__(self):
+        super().__init__()
+        self.gerador = GeradorPix()
+        self.current_payload = None
+        self.is_dark_theme = False
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.id_geracao = 0
+        self.dados_geracao = None
+        self.tarefa_atual = None
+        self.init_ui()
+
+    def init_ui(self):
+        """Inicializa a interface do usuário"""
+        self.setWindowTitle("Gerador de Chaves Pix")
+        self.setGeometry(100, 100, 900, 650)
+        
+        container = QWidget()
+        self.setCentralWidget(container)
+        main_layout = QVBoxLayout(container)
+        main_layout.setSpacing(15)
+
+        self.apply_styles()
+
+        title = QLabel("Gerador de Pix")
+        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(title)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        main_layout.addWidget(splitter, 1)
+        
+        form_widget = QWidget()
+        form_layout = QVBoxLayout(form_widget)
+        splitter.addWidget(form_widget)
+        
+        form_group = QGroupBox("Dados do Pix")
+        form_fields = QFormLayout()
+        
+        self.tipo_chave = QComboBox()
+        self.tipo_chave.addItems(["E-mail", "CPF", "CNPJ", "Telefone", "Chave aleatória"])
+        form_fields.addRow("Tipo de chave:", self.tipo_chave)
+        
+        self.chave_input = QLineEdit()
+        self.chave_input.setPlaceholderText("Chave Pix (e-mail, CPF, etc.)")
+        form_fields.addRow("Chave PIX:", self.chave_input)
+        
+        valor_layout = QHBoxLayout()
+        self.valor_inteiro = QSpinBox()
+        self.valor_inteiro.setRange(0, 999999)
+        self.valor_inteiro.setPrefix("R$ ")
+        self.valor_inteiro.setFixedWidth(130)
+        self.valor_centavos = QSpinBox()
+        self.valor_centavos.setRange(0, 99)
+        self.valor_centavos.setSuffix(" centavos")
+        self.valor_centavos.setFixedWidth(130)
+        valor_layout.addWidget(self.valor_inteiro)
+        valor_layout.addWidget(QLabel(","))
+        valor_layout.addWidget(self.valor_centavos)
+        valor_layout.addStretch()
+        form_fields.addRow("Valor:", valor_layout)
+        
+        self.txid_input = QLineEdit()
+        self.txid_input.setPlaceholderText("Identificador (txid)")
+        form_fields.addRow("Identificador:", self.txid_input)
+        
+        info_layout = QHBoxLayout()
+        self.nome_input = QLineEdit("N")
+        self.nome_input.setFixedWidth(130)
+        info_layout.addWidget(QLabel("Nome:"))
+        info_layout.addWidget(self.nome_input)
+        self.cidade_input = QLineEdit("C")
+        self.cidade_input.setFixedWidth(130)
+        info_layout.addWidget(QLabel("Cidade:"))
+        info_layout.addWidget(self.cidade_input)
+        form_fields.addRow("Informações adicionais:", info_layout)
+        
+        qr_size_layout = QHBoxLayout()
+        self.qr_size = QSpinBox()
+        self.qr_size.setRange(100, 1000)
+        self.qr_size.setValue(200)
+        self.qr_size.setSuffix(" px")
+        qr_size_layout.addWidget(QLabel("Tamanho do QR:"))
+        qr_size_layout.addWidget(self.qr_size)
+        qr_size_layout.addStretch()
+        form_fields.addRow("Tamanho do QR:", qr_size_layout)
+        
+        self.preview_check = QCheckBox("Atualizar enquanto digita")
+        form_fields.addRow("Pré-visualização:", self.preview_check)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(300)
+        self.preview_timer.timeout.connect(self.generate_preview)
+        for campo in (self.chave_input, self.txid_input, self.nome_input, self.cidade_input):
+            campo.textChanged.connect(self.schedule_preview)
+        for campo in (self.valor_inteiro, self.valor_centavos, self.qr_size):
+            campo.valueChanged.connect(self.schedule_preview)
+        self.tipo_chave.currentTextChanged.connect(self.schedule_preview)
+        self.preview_check.toggled.connect(self.schedule_preview)
+        
+        form_group.setLayout(form_fields)
+        form_layout.addWidget(form_group)
+        
+        buttons_layout = QHBoxLayout()
+        self.gerar_btn = QPushButton("Gerar Pix")
+        self.gerar_btn.setIcon(self.style().standardIcon(QApplication.style().StandardPixmap.SP_DialogApplyButton))
+        self.gerar_btn.clicked.connect(self.generate_pix)
+        buttons_layout.addWidget(self.gerar_btn)
+        
+        self.limpar_btn = QPushButton("Limpar")
+        self.limpar_btn.setIcon(self.style().standardIcon(QApplication.style().StandardPixmap.SP_DialogResetButton))
+        self.limpar_btn.clicked.connect(self.clear_form)
+        buttons_layout.addWidget(self.limpar_btn)
+        
+        self.theme_btn = QPushButton("Modo Escuro")
+        self.theme_btn.clicked.connect(self.toggle_theme)
+        buttons_layout.addWidget(self.theme_btn)
+        
+        form_layout.addLayout(buttons_layout)
+        form_layout.addStretch()
+        
+        result_widget = QWidget()
+        result_layout = QVBoxLayout(result_widget)
+        splitter.addWidget(result_widget)
+        
+        self.qr_group = QGroupBox("QR Code")
+        qr_layout = QVBoxLayout()
+        self.qr_label = QLabel()
+        self.qr_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.qr_label.setMinimumSize(200, 200)
+        qr_layout.addWidget(self.qr_label)
+        qr_btn_layout = QHBoxLayout()
+        self.save_qr_btn = QPushButton("Salvar QR Code")
+        self.save_qr_btn.setIcon(self.style().standardIcon(QApplication.style().StandardPixmap.SP_DialogSaveButton))
+        self.save_qr_btn.clicked.connect(self.save_qrcode)
+        self.save_qr_btn.setEnabled(False)
+        qr_btn_layout.addWidget(self.save_qr_btn)
+        qr_layout.addLayout(qr_btn_layout)
+        self.qr_group.setLayout(qr_layout)
+        result_layout.addWidget(self.qr_group)
+        
+        self.payload_group = QGroupBox("Pix Copia e Cola")
+        payload_layout = QVBoxLayout()
+        self.payload_text = QTextEdit()
+        self.payload_text.setReadOnly(True)
+        self.payload_text.setMinimumHeight(100)
+        payload_layout.addWidget(self.payload_text)
+        copy_btn = QPushButton("Copiar Código")
+        copy_btn.setIcon(self.style().standardIcon(QApplication.style().StandardPixmap.SP_DialogSaveButton))
+        copy_btn.clicked.connect(self.copy_payload)
+        payload_layout.addWidget(copy_btn)
+        self.payload_group.setLayout(payload_layout)
+        result_layout.addWidget(self.payload_group)
+        
+        self.details_group = QGroupBox("Detalhes")
+        details_layout = QVBoxLayout()
+        self.details_text = QTextEdit()
+        self.details_text.setReadOnly(True)
+        details_layout.addWidget(self.details_text)
+        self.details_group.setLayout(details_layout)
+        result_layout.addWidget(self.details_group)
+        
+        splitter.setSizes([350, 550])
+        self.statusBar().showMessage("Pronto para gerar códigos PIX")
+
+    def apply_styles(self):
+        """Aplica estilos CSS à interface"""
+        if self.is_dark_theme:
+            self.setStyleSheet("""
+                QMainWindow { background-color: #2b2b2b; }
+                QLabel { font-size: 14px; color: #e0e0e0; }
+                QLineEdit, QComboBox, QSpinBox { 
+                    padding: 8px; 
+                    font-size: 14px; 
+                    border: 1px solid #555; 
+                    border-radius: 5px; 
+                    background-color: #3c3c3c; 
+                    color: #e0e0e0;
+                }
+                QComboBox::drop-down { 
+                    border-left: 1px solid #555; 
+                    padding: 0 5px; 
+                }
+                QPushButton { 
+                    background-color: #4CAF50; 
+                    color: white; 
+                    padding: 10px; 
+                    font-size: 14px; 
+                    border: none; 
+                    border-radius: 5px; 
+                    min-width: 120px;
+                }
+                QPushButton:hover { background-color: #45a049; }
+                QPushButton:disabled { background-color: #666; color: #999; }
+                QTextEdit { 
+                    font-family: 'Courier New'; 
+                    font-size: 12px; 
+                    border: 1px solid #555; 
+                    border-radius: 5px; 
+                    background-color: #3c3c3c; 
+                    color: #e0e0e0;
+                }
+                QGroupBox { 
+                    font-weight: bold; 
+                    font-size: 14px; 
+                    padding: 15px; 
+                    margin-top: 15px; 
+                    border: 1px solid #555; 
+                    border-radius: 5px; 
+                    background-color: #333; 
+                    color: #e0e0e0;
+                }
+                QGroupBox::title { padding: 0 5px; color: #e0e0e0; }
+                #limpar_btn { background-color: #f44336; }
+                #limpar_btn:hover { background-color: #d32f2f; }
+            """)
+        else:
+            self.setStyleSheet("""
+                QMainWindow { background-color: #f5f5f5; }
+                QLabel { font-size: 14px; color: #333; }
+                QLineEdit, QComboBox, QSpinBox { 
+                    padding: 8px; 
+                    font-size: 14px; 
+                    border: 1px solid #ccc; 
+                    border-radius: 5px; 
+                    background-color: #ffffff; 
+                    color: #333333;
+                }
+                QComboBox::drop-down { 
+                    border-left: 1px solid #ccc; 
+                    padding: 0 5px; 
+                }
+                QComboBox::down-arrow { 
+                    image: url(:/down-arrow);
+                }
+                QPushButton { 
+                    background-color: #4CAF50; 
+                    color: white; 
+                    padding: 10px; 
+                    font-size: 14px; 
+                    border: none; 
+                    border-radius: 5px; 
+                    min-width: 120px;
+                }
+                QPushButton:hover { background-color: #45a049; }
+                QPushButton:disabled { background-color: #cccccc; color: #666666; }
+                QTextEdit { 
+                    font-family: 'Courier New'; 
+                    font-size: 12px; 
+                    border: 1px solid #ccc; 
+                    border-radius: 5px; 
+                    background-color: #ffffff; 
+                    color: #333333;
+                }
+                QGroupBox { 
+                    font-weight: bold; 
+                    font-size: 14px; 
+                    padding: 15px; 
+                    margin-top: 15px; 
+                    border: 1px solid #ddd; 
+                    border-radius: 5px; 
+                    background-color: #ffffff;
+                }
+                QGroupBox::title { padding: 0 5px; color: #333; }
+                #limpar_btn { background-color: #f44336; }
+                #limpar_btn:hover { background-color: #d32f2f; }
+            """)
+
+    def toggle_theme(self):
+        """Alterna entre tema claro e escuro"""
+        self.is_dark_theme = not self.is_dark_theme
+        self.theme_btn.setText("Modo Claro" if self.is_dark_theme else "Modo Escuro")
+        self.apply_styles()
+        self.style().polish(self)
+
+    def validate_key(self, chave, tipo):
+        """Valida a chave PIX com base no tipo selecionado"""
+        return validar_chave(chave, tipo) == OK
+
+    def generate_pix(self):
+        """Gera o payload e QR Code"""
+        self.start_generation(silencioso=False)
+
+    def schedule_preview(self, *args):
+        """Reinicia o temporizador da pré-visualização (debounce)"""
+        if self.preview_check.isChecked():
+            self.preview_timer.start()
+
+    def generate_preview(self):
+        """Gera a pré-visualização com os dados atuais do formulário"""
+        if self.preview_check.isChecked():
+            self.start_generation(silencioso=True)
+
+    def start_generation(self, silencioso=False):
+        """Valida o formulário e agenda a geração em segundo plano.
+
+        Gerações ainda na fila são descartadas e uma em andamento tem o
+        resultado ignorado: só a mais recente chega à tela. No modo
+        silencioso (pré-visualização) os erros vão apenas para a barra de
+        status.
+        """
+        # Invalida a geração anterior antes de validar: um formulário inválido
+        # não pode deixar o resultado da entrada antiga chegar à tela
+        self.cancel_generation()
+        chave = self.chave_input.text().strip()
+        tipo = self.tipo_chave.currentText()
+        if not chave:
+            if silencioso:
+                self.clear_result()  # a pré-visualização anterior não vale mais
+            else:
+                self.show_error("A chave PIX é obrigatória!")
+            return
+        if not self.validate_key(chave, tipo):
+            if silencioso:
+                self.clear_result()
+            self.report_error(f"Chave inválida para o tipo {tipo}!", silencioso)
+            return
+            
+        valor_reais = self.valor_inteiro.value()
+        valor_centavos = self.valor_centavos.value()
+        dados = {
+            "chave": chave,
+            "valor": Decimal(f"{valor_reais}.{valor_centavos:02d}"),
+            "txid": self.txid_input.text().strip() or "***",
+            "nome": self.nome_input.text().strip() or "N",
+            "cidade": self.cidade_input.text().strip() or "C",
+            "qr_size": self.qr_size.value(),
+            "silencioso": silencioso,
+        }
+
+        self.dados_geracao = dados
+        tarefa = TarefaGeracao(self.id_geracao, dados, self.gerador.cache_qr, self.is_current_generation)
+        tarefa.sinais.concluida.connect(self.generation_finished)
+        tarefa.sinais.falhou.connect(self.generation_failed)
+        self.tarefa_atual = tarefa
+        self.pool.start(tarefa)
+        self.statusBar().showMessage("Gerando PIX...")
+
+    def cancel_generation(self):
+        """Descarta as gerações pendentes e invalida a que estiver em andamento"""
+        self.id_geracao += 1
+        self.pool.clear()
+
+    def is_current_generation(self, id_tarefa):
+        """Indica se a tarefa ainda é a geração mais recente"""
+        return id_tarefa == self.id_geracao
+
+    def generation_finished(self, id_tarefa, resultado):
+        """Exibe o resultado de uma geração concluída (thread da interface)"""
+        if not self.is_current_generation(id_tarefa):
+            return
+        payload, imagem, parsed = resultado
+        dados = self.dados_geracao
+        self.current_payload = payload
+        
+        self.payload_text.setText(payload)
+        self.qr_label.setPixmap(QPixmap.fromImage(imagem))
+        self.save_qr_btn.setEnabled(True)
+        
+        self.update_details(dados["chave"], dados["valor"], dados["txid"], dados["nome"], dados["cidade"],
+                            payload, parsed)
+        
+        self.statusBar().showMessage("PIX gerado com sucesso!")
+
+    def generation_failed(self, id_tarefa, message):
+        """Exibe o erro de uma geração que falhou (thread da interface)"""
+        if self.is_current_generation(id_tarefa):
+            self.report_error(message, self.dados_geracao["silencioso"])
+
+    def report_error(self, message, silencioso):
+        """Exibe o erro em diálogo ou, no modo silencioso, só na barra de status"""
+        if silencioso:
+            self.statusBar().showMessage(f"Erro: {message}", 5000)
+        else:
+            self.show_error(message)
+
+    def update_details(self, chave, valor, txid, nome, cidade, payload, parsed=None):
+        """Atualiza as informações detalhadas do PIX"""
+        tipo_chave = self.tipo_chave.currentText()
+        if parsed is None:
+            parsed = self.gerador.parse_payload(payload)
+        
+        details = f"**Detalhes do PIX:**\n\n"
+        details += f"**Tipo de chave:** {tipo_chave}\n"
+        details += f"**Chave PIX:** {chave}\n"
+        details += f"**Valor:** R$ {valor:.2f}\n"
+        details += f"**Identificador (txid):** {txid}\n"
+        details += f"**Nome do recebedor:** {nome}\n"
+        details += f"**Cidade do recebedor:** {cidade}\n"
+        
+        details += "\n**Campos EMV Decodificados:**\n"
+        for id_campo, valor in parsed.items():
+            campo_nome = NOMES_CAMPOS.get(id_campo, f"Unknown ({id_campo})")
+            details += f"{id_campo}: {campo_nome} = {valor}\n"
+        
+        self.details_text.setMarkdown(details)
+
+    def save_qrcode(self):
+        """Salva o QR code em um arquivo"""
+        if not self.current_payload:
+            return
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Salvar QR Code", os.path.expanduser("~/pix_qrcode.png"),
+            "PNG (*.png);;SVG vetorial (*.svg);;PDF vetorial (*.pdf);;JPEG (*.jpg *.jpeg)"
+        )
+        if filename:
+            if self.gerador.salvar_qrcode(self.current_payload, filename, self.qr_size.value()):
+                self.statusBar().showMessage(f"QR Code salvo em: {filename}", 5000)
+            else:
+                self.show_error("Erro ao salvar o QR Code")
+
+    def copy_payload(self):
+        """Copia o payload para a área de transferência"""
+        if self.current_payload:
+            clipboard = QApplication.clipboard()
+            clipboard.setText(self.current_payload)
+            self.statusBar().showMessage("Código PIX copiado para a área de transferência!", 3000)
+
+    def clear_form(self):
+        """Limpa todos os campos do formulário"""
+        self.cancel_generation()
+        self.chave_input.clear()
+        self.valor_inteiro.setValue(0)
+        self.valor_centavos.setValue(0)
+        self.txid_input.clear()
+        self.nome_input.setText("N")
+        self.cidade_input.setText("C")
+        self.qr_size.setValue(200)
+        self.preview_timer.stop()
+        self.clear_result()
+        self.statusBar().showMessage("Formulário limpo", 3000)
+
+    def clear_result(self):
+        """Remove da tela o payload, o QR code e os detalhes exibidos"""
+        self.payload_text.clear()
+        self.details_text.clear()
+        self.qr_label.clear()
+        self.current_payload = None
+        self.save_qr_btn.setEnabled(False)
+
+    def closeEvent(self, event):
+        """Descarta as gerações pendentes e espera a atual antes de fechar"""
+        self.cancel_generation()
+        self.pool.waitForDone()
+        super().closeEvent(event)
+
+    def show_error(self, message):
+        """Exibe uma mensagem de erro"""
+        QMessageBox.critical(self, "Erro", message)
+        self.statusBar().showMessage(f"Erro: {message}", 5000)
@@ -0,0 +1,90 @@
+"""Geração de payloads Pix em lote, com execução opcional em vários processos."""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from template import PayloadTemplate
+
+CAMPOS = ("chave_pix", "valor", "txid", "nome_merchant", "cidade_merchant")
+PADROES = (None, None, "***", "N", "C")
+
+
+@lru_cache(maxsize=1024)
+def obter_template(chave_pix, nome_merchant="N", cidade_merchant="C"):
+    """Template compilado por recebedor, reaproveitado dentro de cada processo"""
+    return PayloadTemplate(chave_pix, nome_merchant, cidade_merchant)
+
+
+def _argumentos(linha):
+    """Normaliza uma linha (dict ou sequência) nos argumentos de gerar_payload"""
+    if isinstance(linha, dict):
+        return tuple(linha.get(campo, padrao) for campo, padrao in zip(CAMPOS, PADROES))
+    if isinstance(linha, str):
+        return (linha,) + PADROES[1:]
+    return tuple(linha) + PADROES[len(linha):]
+
+
+def gerar_bloco(linhas):
+    """Gera os payloads de um bloco de linhas, na mesma ordem"""
+    payloads = []
+    for linha in linhas:
+        chave_pix, valor, txid, nome_merchant, cidade_merchant = _argumentos(linha)
+        template = obter_template(chave_pix, nome_merchant, cidade_merchant)
+        payloads.append(template.render(valor, txid))
+    return payloads
+
+
+def _blocos(linhas, tamanho_lote):
+    """Divide um iterável em listas de até ``tamanho_lote`` itens"""
+    iterador = iter(linhas)
+    while True:
+        bloco = list(islice(iterador, tamanho_lote))
+        if not bloco:
+            return
+        yield bloco
+
+
+def mapear_em_blocos(funcao, linhas, tamanho_lote=10000, processos=1):
+    """Aplica ``funcao`` a blocos de ``linhas`` e devolve os resultados em ordem.
+
+    Com ``processos`` diferente de 1 os blocos são distribuídos entre
+    processos (``None`` usa todos os núcleos); ``funcao`` precisa então ser
+    serializável com pickle. No máximo dois blocos por processo ficam em
+    trânsito, então o uso de memória depende do tamanho do lote e não do
+    tamanho da entrada.
+    """
+    if tamanho_lote < 1:
+        raise ValueError("tamanho_lote deve ser pelo menos 1")
+
+    if processos == 1:
+        for bloco in _blocos(linhas, tamanho_lote):
+            yield funcao(bloco)
+        return
+
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = processos * 2
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for bloco in _blocos(linhas, tamanho_lote):
+            pendentes.append(executor.submit(funcao, bloco))
+            if len(pendentes) >= max_pendentes:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+
+def gerar_payloads_em_lote(linhas, tamanho_lote=10000, processos=1):
+    """Gera payloads Pix para um fluxo de cobranças, devolvendo-os em blocos.
+
+    Cada linha pode ser um dict com as chaves de ``GeradorPix.gerar_payload``
+    (``chave_pix``, ``valor``, ``txid``, ``nome_merchant``, ``cidade_merchant``),
+    uma sequência com esses valores na mesma ordem ou apenas a chave Pix.
+    Os payloads saem na ordem de entrada, em listas de até ``tamanho_lote``.
+
+    Com ``processos`` diferente de 1 o trabalho é distribuído entre processos
+    (``None`` usa todos os núcleos), mantendo o uso de memória limitado ao
+    tamanho do lote; veja ``mapear_em_blocos``.
+    """
+    return mapear_em_blocos(gerar_bloco, linhas, tamanho_lote, processos)
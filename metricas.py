@@ -0,0 +1,189 @@
+"""Instrumentação opcional dos caminhos críticos do GeradorPix.
+
+Um ``GeradorPix`` criado com ``metricas=Metricas()`` mede cada etapa de
+``gerar_payload``, ``gerar_payload_dinamico``, ``gerar_qrcode_pillow``,
+``gerar_qrcode_qimage``, ``gerar_qrcode_pixmap`` e ``salvar_qrcode`` e
+acumula histogramas de duração e contadores de erro. Sem métricas, os
+métodos usam ``SEM_MEDICAO``, um contexto que não faz nada. Os dados saem em texto do Prometheus ou em JSON (uma
+linha por histograma), e callbacks recebem cada etapa medida para
+alimentar um tracer externo.
+"""
+import json
+import threading
+from bisect import bisect_left
+from time import perf_counter_ns
+
+# Limites superiores dos baldes dos histogramas, em segundos
+LIMITES_PADRAO = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+                  1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+PREFIXO = "gerador_pix"
+
+
+class Medicao:
+    """Mede uma chamada de ``metodo`` em um bloco ``with``; criada por ``Metricas.medir``.
+
+    ``marca()`` fecha a etapa atual e abre a próxima. Ao sair do bloco a
+    última etapa é fechada e a chamada registrada; se o bloco levantar uma
+    exceção, ela é contada como erro de ``metodo`` e segue adiante.
+    """
+
+    __slots__ = ('metricas', 'metodo', 'etapas', 'marcas')
+
+    def __init__(self, metricas, metodo, etapas):
+        self.metricas = metricas
+        self.metodo = metodo
+        self.etapas = etapas
+        self.marcas = []
+
+    def __enter__(self):
+        self.marcas.append(perf_counter_ns())
+        return self
+
+    def marca(self):
+        """Fecha a etapa atual e começa a próxima"""
+        self.marcas.append(perf_counter_ns())
+
+    def __exit__(self, tipo, excecao, rastro):
+        if excecao is None:
+            self.marcas.append(perf_counter_ns())
+            self.metricas.registrar(self.metodo, self.etapas, self.marcas)
+        else:
+            self.metricas.erro(self.metodo, excecao)
+        return False
+
+
+class _SemMedicao:
+    """Contexto com a interface de ``Medicao`` que não mede nada"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def marca(self):
+        pass
+
+    def __exit__(self, tipo, excecao, rastro):
+        return False
+
+
+SEM_MEDICAO = _SemMedicao()
+
+
+class Metricas:
+    """Histogramas de duração por (método, etapa) e contadores de erro, thread-safe.
+
+    Cada callback registrado é chamado como ``callback(metodo, etapa,
+    inicio_ns, duracao_ns)`` para cada etapa medida, inclusive a etapa
+    ``"total"`` do método, fora do lock e na thread que fez a chamada. Uma
+    exceção no callback não chega ao método medido: só é contada em
+    ``erros_callback``.
+    """
+
+    def __init__(self, limites=LIMITES_PADRAO):
+        self.limites = tuple(limites)
+        self._limites_ns = [round(limite * 1e9) for limite in self.limites]
+        self._histogramas = {}
+        self._erros = {}
+        self._callbacks = ()
+        self._lock = threading.Lock()
+        self.erros_callback = 0
+
+    def adicionar_callback(self, callback):
+        """Registra uma função a ser chamada para cada etapa medida"""
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def remover_callback(self, callback):
+        """Remove um callback registrado com ``adicionar_callback``"""
+        with self._lock:
+            self._callbacks = tuple(c for c in self._callbacks if c is not callback)
+
+    def registrar(self, metodo, etapas, marcas):
+        """Registra uma chamada de ``metodo`` a partir dos instantes medidos.
+
+        ``marcas`` tem um instante (``time.perf_counter_ns``) a mais que
+        ``etapas``: a etapa ``i`` vai de ``marcas[i]`` a ``marcas[i + 1]``.
+        """
+        duracoes = [(etapa, marcas[i], marcas[i + 1] - marcas[i]) for i, etapa in enumerate(etapas)]
+        duracoes.append(("total", marcas[0], marcas[-1] - marcas[0]))
+        with self._lock:
+            for etapa, _, duracao in duracoes:
+                chave = (metodo, etapa)
+                histograma = self._histogramas.get(chave)
+                if histograma is None:
+                    histograma = self._histogramas[chave] = [[0] * (len(self.limites) + 1), 0]
+                histograma[0][bisect_left(self._limites_ns, duracao)] += 1
+                histograma[1] += duracao
+            callbacks = self._callbacks
+        for callback in callbacks:
+            for etapa, inicio, duracao in duracoes:
+                try:
+                    callback(metodo, etapa, inicio, duracao)
+                except Exception:
+                    with self._lock:
+                        self.erros_callback += 1
+
+    def medir(self, metodo, etapas):
+        """Retorna uma ``Medicao`` de ``metodo`` com as ``etapas`` indicadas, para usar com ``with``"""
+        return Medicao(self, metodo, etapas)
+
+    def erro(self, metodo, excecao=None):
+        """Conta um erro de ``metodo``"""
+        with self._lock:
+            self._erros[metodo] = self._erros.get(metodo, 0) + 1
+
+    def limpar(self):
+        """Zera histogramas e contadores (os callbacks são mantidos)"""
+        with self._lock:
+            self._histogramas.clear()
+            self._erros.clear()
+            self.erros_callback = 0
+
+    def resumo(self):
+        """Retorna uma cópia dos dados: lista de histogramas e dict de erros por método"""
+        with self._lock:
+            histogramas = [(metodo, etapa, list(baldes), soma)
+                           for (metodo, etapa), (baldes, soma) in sorted(self._histogramas.items())]
+            return histogramas, dict(self._erros)
+
+    def prometheus(self):
+        """Exporta as métricas no formato texto do Prometheus"""
+        histogramas, erros = self.resumo()
+        nome = f"{PREFIXO}_etapa_segundos"
+        linhas = [f"# HELP {nome} Duração de cada etapa dos métodos do GeradorPix.",
+                  f"# TYPE {nome} histogram"]
+        for metodo, etapa, baldes, soma in histogramas:
+            rotulos = f'metodo="{metodo}",etapa="{etapa}"'
+            acumulado = 0
+            for limite, quantidade in zip(self.limites + (float("inf"),), baldes):
+                acumulado += quantidade
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                linhas.append(f'{nome}_bucket{{{rotulos},le="{le}"}} {acumulado}')
+            linhas.append(f"{nome}_sum{{{rotulos}}} {soma / 1e9!r}")
+            linhas.append(f"{nome}_count{{{rotulos}}} {acumulado}")
+        nome = f"{PREFIXO}_erros_total"
+        linhas += [f"# HELP {nome} Erros por método do GeradorPix.", f"# TYPE {nome} counter"]
+        linhas += [f'{nome}{{metodo="{metodo}"}} {quantidade}' for metodo, quantidade in sorted(erros.items())]
+        nome = f"{PREFIXO}_erros_callback_total"
+        linhas += [f"# HELP {nome} Exceções levantadas pelos callbacks de métricas.", f"# TYPE {nome} counter",
+                   f"{nome} {self.erros_callback}"]
+        return "\n".join(linhas) + "\n"
+
+    def json_linhas(self):
+        """Exporta as métricas em JSON, um objeto por linha (histogramas e depois erros)"""
+        histogramas, erros = self.resumo()
+        linhas = []
+        for metodo, etapa, baldes, soma in histogramas:
+            linhas.append(json.dumps({
+                "metodo": metodo,
+                "etapa": etapa,
+                "n": sum(baldes),
+                "soma_s": soma / 1e9,
+                "baldes": dict(zip([str(limite) for limite in self.limites] + ["+Inf"], baldes)),
+            }))
+        linhas += [json.dumps({"metodo": metodo, "erros": quantidade}) for metodo, quantidade in sorted(erros.items())]
+        if self.erros_callback:
+            linhas.append(json.dumps({"erros_callback": self.erros_callback}))
+        return "".join(linha + "\n" for linha in linhas)
@@ -0,0 +1,59 @@
+"""Escrita incremental de arquivos PDF, sem dependências externas."""
+import zlib
+
+CABECALHO = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+
+
+def texto_pdf(texto):
+    """Codifica ``texto`` como string literal de PDF (WinAnsi), com os escapes necessários"""
+    dados = texto.encode("cp1252", "replace")
+    return b"(" + dados.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+class EscritorPDF:
+    """Grava um PDF objeto a objeto em um arquivo binário.
+
+    Cada objeto vai para o arquivo assim que é escrito; só a posição de
+    cada um fica em memória, para a tabela xref final. Os números dos
+    objetos são obtidos com ``reservar`` e podem ser referenciados antes de
+    o objeto ser escrito. O arquivo não precisa aceitar ``seek``.
+    """
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self.posicoes = {}
+        self.proximo = 1
+        self._posicao = 0
+        self._escrever(CABECALHO)
+
+    def _escrever(self, dados):
+        self.arquivo.write(dados)
+        self._posicao += len(dados)
+
+    def reservar(self):
+        """Reserva e retorna o número do próximo objeto"""
+        numero = self.proximo
+        self.proximo += 1
+        return numero
+
+    def objeto(self, numero, conteudo):
+        """Escreve o objeto ``numero`` com o ``conteudo`` (bytes) dado"""
+        self.posicoes[numero] = self._posicao
+        self._escrever(b"%d 0 obj\n%s\nendobj\n" % (numero, conteudo))
+
+    def fluxo(self, numero, dados, comprimido=False):
+        """Escreve um objeto stream, comprimindo ``dados`` com zlib se ainda não estiverem"""
+        if not comprimido:
+            dados = zlib.compress(dados, 9)
+        self.objeto(numero, b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(dados), dados))
+
+    def fechar(self, raiz):
+        """Escreve a tabela xref e o trailer; ``raiz`` é o número do catálogo"""
+        faltando = set(range(1, self.proximo)) - self.posicoes.keys()
+        if faltando:
+            raise ValueError(f"objetos reservados e não escritos: {sorted(faltando)}")
+        xref = self._posicao
+        total = self.proximo
+        self._escrever(b"xref\n0 %d\n0000000000 65535 f \n" % total)
+        self._escrever(b"".join(b"%010d 00000 n \n" % self.posicoes[numero] for numero in range(1, total)))
+        self._escrever(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (total, raiz, xref))
@@ -0,0 +1,153 @@
+"""Pool de cobranças Pix dinâmicas preparadas antes da demanda.
+
+O payload de um Pix dinâmico só depende da URL da location, não do valor
+nem do txid, então locations, payloads e QR codes podem ser criados com
+antecedência: no checkout basta retirar um item pronto do pool e associar a
+cobrança à location no PSP. O pool é reabastecido em segundo plano por um
+número limitado de threads sempre que cai abaixo do mínimo; se estiver vazio,
+o item é preparado na hora, como sem o pool.
+
+As threads servem para sobrepor as chamadas ao PSP; a renderização dos QR
+codes disputa o GIL com o resto do processo.
+"""
+import threading
+import time
+import uuid
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from gerador import GeradorPix
+
+CobrancaPronta = namedtuple("CobrancaPronta", ("location_id", "url", "payload", "imagem"))
+CobrancaPronta.__doc__ = "Location já criada no PSP com o payload e o QR code (bytes ou None) prontos"
+
+
+class PoolDinamico:
+    """Mantém até ``tamanho`` cobranças dinâmicas prontas para o ``psp`` (``psp.ClientePSP`` ou ``psp.PSPLocal``).
+
+    Quando restam ``minimo`` itens ou menos (metade do tamanho, por
+    padrão), o pool volta a ser enchido com no máximo ``concorrencia``
+    preparações simultâneas. Com ``formato=None`` só os payloads são
+    preparados, sem QR code. Uma falha do PSP é contada e a thread espera
+    ``espera_erro`` segundos antes da próxima tentativa.
+    """
+
+    def __init__(self, psp, chave_pix=None, nome_merchant="N", cidade_merchant="C", tamanho=64, minimo=None,
+                 concorrencia=4, formato="PNG", size=300, gerador=None, espera_erro=1.0):
+        if tamanho < 1 or concorrencia < 1:
+            raise ValueError("tamanho e concorrencia devem ser pelo menos 1")
+        self.psp = psp
+        self.chave_pix = chave_pix
+        self.nome_merchant = nome_merchant
+        self.cidade_merchant = cidade_merchant
+        self.tamanho = tamanho
+        self.minimo = tamanho // 2 if minimo is None else min(minimo, tamanho - 1)
+        self.concorrencia = concorrencia
+        self.formato = formato
+        self.size = size
+        self.gerador = gerador if gerador is not None else GeradorPix()
+        self.espera_erro = espera_erro
+        self.retiradas = 0
+        self.faltas = 0
+        self.erros = 0
+        self.ultimo_erro = None
+        self._fila = deque()
+        self._em_preparo = 0
+        self._condicao = threading.Condition()
+        self._executor = None
+        self._fechado = False
+
+    def iniciar(self):
+        """Começa a encher o pool em segundo plano e retorna o próprio pool"""
+        with self._condicao:
+            if self._executor is None and not self._fechado:
+                self._executor = ThreadPoolExecutor(self.concorrencia, thread_name_prefix="pool-pix")
+                self._reabastecer()
+        return self
+
+    def preparar(self):
+        """Cria uma location no PSP e prepara o payload e o QR code dela"""
+        location = self.psp.criar_location()
+        payload = self.gerador.gerar_payload_dinamico(location.url, None, self.nome_merchant, self.cidade_merchant)
+        imagem = None
+        if self.formato:
+            from qr import gerar_qrcode_bytes
+            imagem = gerar_qrcode_bytes(payload, self.formato, self.size)
+        return CobrancaPronta(location.id, location.url, payload, imagem)
+
+    def _reabastecer(self):
+        """Agenda as preparações que faltam; chamado com ``_condicao`` adquirida"""
+        if self._fechado or self._executor is None or len(self._fila) + self._em_preparo > self.minimo:
+            return
+        for _ in range(self.tamanho - len(self._fila) - self._em_preparo):
+            self._em_preparo += 1
+            self._executor.submit(self._tarefa)
+
+    def _tarefa(self):
+        item = None
+        try:
+            item = self.preparar()
+        except Exception as e:
+            with self._condicao:
+                self.erros += 1
+                self.ultimo_erro = e
+            time.sleep(self.espera_erro)
+        with self._condicao:
+            self._em_preparo -= 1
+            if item is not None:
+                self._fila.append(item)
+                self._condicao.notify_all()
+            self._reabastecer()
+
+    def retirar(self, timeout=0.0):
+        """Retira uma ``CobrancaPronta`` do pool.
+
+        Se o pool estiver vazio, espera até ``timeout`` segundos por um item
+        e, depois disso, prepara um na hora (contado em ``faltas``).
+        """
+        with self._condicao:
+            if not self._fila and timeout:
+                self._condicao.wait_for(lambda: self._fila, timeout)
+            if self._fila:
+                item = self._fila.popleft()
+                self.retiradas += 1
+                self._reabastecer()
+                return item
+            self.faltas += 1
+        return self.preparar()
+
+    def cobrar(self, valor, txid=None, timeout=0.0):
+        """Retira um item e cria nele a cobrança de ``valor``; retorna ``(CobrancaPronta, cobranca)``.
+
+        Sem ``txid``, é usado um identificador aleatório de 32 caracteres.
+        """
+        item = self.retirar(timeout)
+        txid = txid or uuid.uuid4().hex
+        return item, self.psp.criar_cobranca(txid, item.location_id, valor, self.chave_pix)
+
+    def aguardar(self, timeout=None):
+        """Espera o pool encher (útil no aquecimento); retorna False se o tempo acabar antes"""
+        with self._condicao:
+            return self._condicao.wait_for(lambda: len(self._fila) >= self.tamanho or self._fechado, timeout)
+
+    def estatisticas(self):
+        """Retorna os contadores e a ocupação atual do pool"""
+        with self._condicao:
+            return {"disponiveis": len(self._fila), "em_preparo": self._em_preparo, "retiradas": self.retiradas,
+                    "faltas": self.faltas, "erros": self.erros}
+
+    def fechar(self):
+        """Para o reabastecimento e espera as preparações em andamento; os itens prontos são descartados"""
+        with self._condicao:
+            self._fechado = True
+            executor, self._executor = self._executor, None
+            self._fila.clear()
+            self._condicao.notify_all()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excecao):
+        self.fechar()
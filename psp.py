@@ -0,0 +1,188 @@
+"""Acesso ao PSP para cobranças Pix dinâmicas, e um PSP local para testes.
+
+No Pix dinâmico o BRCode não leva a chave, e sim a URL de uma *location*
+criada no PSP (``POST /v2/loc`` da API Pix do Banco Central); a cobrança,
+com valor e txid, é associada à location depois, com ``PUT /v2/cob/{txid}``.
+``ClientePSP`` usa essa API por HTTP. ``PSPLocal`` implementa as mesmas
+operações em memória, com latência simulada, e pode ser servido por HTTP
+(``python psp.py``) para fazer o papel do PSP real em testes e benchmarks.
+
+Uso: python psp.py [--porta 8081] [--latencia 20]
+"""
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+Location = namedtuple("Location", ("id", "url"))
+Location.__doc__ = "Location criada no PSP: identificador e URL (sem https://) que vai no campo 26/25"
+
+EXPIRACAO_PADRAO = 3600  # segundos até a cobrança expirar
+
+
+class ErroPSP(Exception):
+    """Falha em uma chamada ao PSP; ``status`` é o código HTTP, quando houver"""
+
+    def __init__(self, mensagem, status=None):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def _corpo_cobranca(location_id, valor, chave_pix, expiracao):
+    return {"calendario": {"expiracao": expiracao}, "loc": {"id": location_id},
+            "valor": {"original": f"{valor:.2f}"}, "chave": chave_pix}
+
+
+class ClientePSP:
+    """Cliente da API Pix de um PSP (``/v2/loc`` e ``/v2/cob``), seguro para várias threads.
+
+    Cada chamada abre a sua própria conexão. A autenticação (OAuth2 e
+    certificado mTLS, na API real) fica a cargo de ``token`` e do
+    ``contexto_ssl`` passado ao urllib.
+    """
+
+    def __init__(self, url_base, token=None, timeout=10.0, contexto_ssl=None):
+        self.url_base = url_base.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.contexto_ssl = contexto_ssl
+
+    def _chamar(self, metodo, caminho, corpo):
+        cabecalhos = {"Content-Type": "application/json"}
+        if self.token:
+            cabecalhos["Authorization"] = f"Bearer {self.token}"
+        requisicao = urllib.request.Request(self.url_base + caminho, json.dumps(corpo).encode("utf-8"),
+                                            cabecalhos, method=metodo)
+        try:
+            with urllib.request.urlopen(requisicao, timeout=self.timeout, context=self.contexto_ssl) as resposta:
+                return json.load(resposta)
+        except urllib.error.HTTPError as e:
+            raise ErroPSP(f"{metodo} {caminho}: HTTP {e.code} {e.read()[:200]!r}", e.code) from e
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise ErroPSP(f"{metodo} {caminho}: {e}") from e
+
+    def criar_location(self):
+        """Cria uma location para cobrança imediata e retorna uma ``Location``"""
+        resposta = self._chamar("POST", "/v2/loc", {"tipoCob": "cob"})
+        return Location(resposta["id"], resposta["location"])
+
+    def criar_cobranca(self, txid, location_id, valor, chave_pix, expiracao=EXPIRACAO_PADRAO):
+        """Cria a cobrança ``txid`` na location ``location_id`` e retorna a resposta do PSP"""
+        return self._chamar("PUT", f"/v2/cob/{txid}", _corpo_cobranca(location_id, valor, chave_pix, expiracao))
+
+
+class PSPLocal:
+    """PSP em memória com a mesma interface de ``ClientePSP``, para testes.
+
+    Cada chamada espera ``latencia`` segundos, simulando a ida ao PSP, e as
+    mesmas regras básicas são conferidas: a location precisa existir e só
+    recebe uma cobrança.
+    """
+
+    def __init__(self, latencia=0.0, dominio="pix.psp.local"):
+        self.latencia = latencia
+        self.dominio = dominio
+        self.locations = {}
+        self.cobrancas = {}
+        self._proximo_id = 1
+        self._lock = threading.Lock()
+
+    def criar_location(self):
+        """Cria uma location para cobrança imediata e retorna uma ``Location``"""
+        if self.latencia:
+            time.sleep(self.latencia)
+        with self._lock:
+            location = Location(self._proximo_id, f"{self.dominio}/qr/v2/{uuid.uuid4().hex}")
+            self._proximo_id += 1
+            self.locations[location.id] = None
+        return location
+
+    def criar_cobranca(self, txid, location_id, valor, chave_pix, expiracao=EXPIRACAO_PADRAO):
+        """Cria a cobrança ``txid`` na location ``location_id`` e retorna a cobrança criada"""
+        if self.latencia:
+            time.sleep(self.latencia)
+        with self._lock:
+            if location_id not in self.locations:
+                raise ErroPSP(f"location {location_id} não existe", 404)
+            if self.locations[location_id] is not None or txid in self.cobrancas:
+                raise ErroPSP(f"location {location_id} ou txid {txid} já usados", 409)
+            cobranca = _corpo_cobranca(location_id, valor, chave_pix, expiracao)
+            cobranca.update(txid=txid, status="ATIVA", revisao=0)
+            self.locations[location_id] = txid
+            self.cobrancas[txid] = cobranca
+        return cobranca
+
+
+class _RequisicaoPSP(BaseHTTPRequestHandler):
+    """Atende a API Pix mínima sobre o ``PSPLocal`` em ``self.server.psp``"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _responder(self, status, dados):
+        corpo = json.dumps(dados).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _corpo(self):
+        return json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+
+    def do_POST(self):
+        if self.path != "/v2/loc":
+            return self._responder(404, {"erro": "rota desconhecida"})
+        self._corpo()
+        location = self.server.psp.criar_location()
+        self._responder(201, {"id": location.id, "location": location.url, "tipoCob": "cob"})
+
+    def do_PUT(self):
+        if not self.path.startswith("/v2/cob/"):
+            return self._responder(404, {"erro": "rota desconhecida"})
+        corpo = self._corpo()
+        try:
+            cobranca = self.server.psp.criar_cobranca(self.path[len("/v2/cob/"):], corpo["loc"]["id"],
+                                                      float(corpo["valor"]["original"]), corpo.get("chave"),
+                                                      corpo.get("calendario", {}).get("expiracao", EXPIRACAO_PADRAO))
+        except ErroPSP as e:
+            return self._responder(e.status or 400, {"erro": str(e)})
+        except (KeyError, TypeError, ValueError) as e:
+            return self._responder(400, {"erro": f"corpo inválido: {e}"})
+        self._responder(201, cobranca)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def criar_servidor(psp, host="127.0.0.1", porta=0):
+    """Cria (sem iniciar) um servidor HTTP para o ``psp``; com ``porta=0`` o sistema escolhe a porta"""
+    servidor = ThreadingHTTPServer((host, porta), _RequisicaoPSP)
+    servidor.daemon_threads = True
+    servidor.psp = psp
+    return servidor
+
+
+def main(argv=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="PSP local (API Pix mínima) para testes de Pix dinâmico.")
+    parser.add_argument("--host", default="127.0.0.1", help="endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8081, help="porta de escuta (padrão: 8081)")
+    parser.add_argument("--latencia", type=float, default=0.0, help="latência simulada por chamada, em ms")
+    args = parser.parse_args(argv)
+    servidor = criar_servidor(PSPLocal(args.latencia / 1000), args.host, args.porta)
+    print(f"PSP local ouvindo em {servidor.server_address}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Renderização de QR codes Pix com qrcode e Pillow, sem depender do PyQt6."""
+import io
+import struct
+import zlib
+from itertools import groupby
+
+import qrcode
+from PIL import Image
+
+
+def _novo_qrcode(payload, **kwargs):
+    """Cria o QRCode com os parâmetros usados em todo o projeto"""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=10,
+        border=4,
+        **kwargs,
+    )
+    qr.add_data(payload)
+    qr.make(fit=True)
+    return qr
+
+
+def gerar_matriz(payload, politica=None):
+    """Calcula a matriz de módulos do QR code, já com a borda (quiet zone).
+
+    Retorna uma lista de linhas, cada uma uma lista de bool (True = módulo escuro).
+    Com uma ``codificacao_qr.PoliticaQR``, versão, modos e correção são
+    escolhidos pela codificação adaptativa.
+    """
+    if politica is not None:
+        import codificacao_qr
+        return codificacao_qr.gerar_matriz(payload, politica)
+    return _novo_qrcode(payload).get_matrix()
+
+
+def empacotar_matriz(matriz, size=300):
+    """Desenha a matriz de módulos em um buffer 1-bit de ``size`` x ``size`` pixels.
+
+    Cada módulo ocupa um número inteiro de pixels, então não há reamostragem
+    e as bordas dos módulos ficam nítidas. A sobra da divisão de ``size``
+    pelo número de módulos vira margem branca, distribuída pelos dois lados.
+
+    Retorna ``(dados, bytes_por_linha)``: os pixels empacotados 8 por byte,
+    bit mais significativo primeiro, bit ligado = branco, cada linha
+    completada até o byte. É o formato do modo "1" do Pillow e do
+    ``QImage.Format.Format_Mono``.
+    """
+    n = len(matriz)
+    box = size // n
+    bytes_linha = (size + 7) // 8
+    if box == 0:
+        return renderizar_matriz(matriz, size).tobytes(), bytes_linha
+
+    sobra = size - box * n
+    esquerda = sobra // 2
+    direita = sobra - esquerda
+    preenchimento = bytes_linha * 8 - size
+    escuro, claro = "0" * box, "1" * box
+    branca = b"\xff" * bytes_linha
+
+    linhas = [branca * esquerda]
+    for linha in matriz:
+        bits = "1" * esquerda + "".join(escuro if modulo else claro for modulo in linha) + "1" * direita
+        linhas.append((int(bits, 2) << preenchimento).to_bytes(bytes_linha, "big") * box)
+    linhas.append(branca * direita)
+    return b"".join(linhas), bytes_linha
+
+
+def renderizar_matriz(matriz, size=300):
+    """Desenha a matriz de módulos em uma imagem Pillow 1-bit de ``size`` x ``size`` pixels.
+
+    Veja ``empacotar_matriz``; se ``size`` for menor que o número de
+    módulos, a matriz é desenhada em 1 pixel por módulo e reduzida.
+    """
+    n = len(matriz)
+    if size < n:
+        return renderizar_matriz(matriz, n).resize((size, size), Image.NEAREST)
+    dados, _ = empacotar_matriz(matriz, size)
+    return Image.frombytes("1", (size, size), dados)
+
+
+def segmentos(matriz):
+    """Gera ``(x, y, comprimento)`` para cada sequência horizontal de módulos escuros"""
+    for y, linha in enumerate(matriz):
+        x = 0
+        for escuro, grupo in groupby(linha):
+            comprimento = len(list(grupo))
+            if escuro:
+                yield x, y, comprimento
+            x += comprimento
+
+
+def svg_matriz(matriz, size=300):
+    """Gera um SVG com um único path, um retângulo por sequência de módulos escuros.
+
+    As coordenadas ficam em unidades de módulo (``viewBox``), então o
+    arquivo não depende de ``size``, que só define largura e altura.
+    """
+    n = len(matriz)
+    caminho = "".join(f"M{x} {y}h{c}v1h-{c}z" for x, y, c in segmentos(matriz))
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="0 0 {n} {n}" shape-rendering="crispEdges">'
+            f'<rect width="{n}" height="{n}" fill="#fff"/><path d="{caminho}" fill="#000"/></svg>\n'
+            ).encode("ascii")
+
+
+def pdf_operadores(matriz, x=0, y=0, lado=300):
+    """Operadores de conteúdo PDF que desenham o QR code em vetores.
+
+    O QR code ocupa o quadrado de ``lado`` pontos cujo canto inferior
+    esquerdo está em ``(x, y)``; cada sequência de módulos escuros vira um
+    retângulo preenchido.
+    """
+    n = len(matriz)
+    escala = lado / n
+    retangulos = " ".join(f"{mx} {my} {c} 1 re" for mx, my, c in segmentos(matriz))
+    # A matriz de transformação põe a origem no canto superior esquerdo, em unidades de módulo
+    return (f"q {escala:.4f} 0 0 {-escala:.4f} {x:.2f} {y + lado:.2f} cm 1 g 0 0 {n} {n} re f "
+            f"0 g {retangulos} f Q\n").encode("ascii")
+
+
+def pdf_matriz(matriz, size=300):
+    """Gera um PDF de uma página de ``size`` x ``size`` pontos (1/72 de polegada) com o QR code"""
+    from pdf import EscritorPDF
+
+    buffer = io.BytesIO()
+    pdf = EscritorPDF(buffer)
+    catalogo, paginas, pagina, conteudo = (pdf.reservar() for _ in range(4))
+    pdf.objeto(catalogo, b"<< /Type /Catalog /Pages %d 0 R >>" % paginas)
+    pdf.objeto(paginas, b"<< /Type /Pages /Kids [%d 0 R] /Count 1 >>" % pagina)
+    pdf.objeto(pagina, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+                       b"/Resources << >> >>" % (paginas, size, size, conteudo))
+    pdf.fluxo(conteudo, pdf_operadores(matriz, 0, 0, size))
+    pdf.fechar(catalogo)
+    return buffer.getvalue()
+
+
+def _bloco_png(tipo, dados):
+    return struct.pack(">I", len(dados)) + tipo + dados + struct.pack(">I", zlib.crc32(tipo + dados))
+
+
+def png_matriz(matriz, size=300, nivel=9):
+    """Gera um PNG em tons de cinza de 1 bit por pixel direto dos pixels empacotados.
+
+    Linhas iguais à anterior (todas as linhas de um mesmo módulo, menos a
+    primeira) usam o filtro "Up" do PNG e viram só zeros, que o zlib
+    comprime quase a nada.
+    """
+    dados, bytes_linha = empacotar_matriz(matriz, size)
+    repetida = b"\x02" + bytes(bytes_linha)
+    linhas = []
+    anterior = None
+    for inicio in range(0, len(dados), bytes_linha):
+        linha = dados[inicio:inicio + bytes_linha]
+        linhas.append(repetida if linha == anterior else b"\x00" + linha)
+        anterior = linha
+    return (b"\x89PNG\r\n\x1a\n"
+            + _bloco_png(b"IHDR", struct.pack(">IIBBBBB", size, size, 1, 0, 0, 0, 0))
+            + _bloco_png(b"IDAT", zlib.compress(b"".join(linhas), nivel))
+            + _bloco_png(b"IEND", b""))
+
+
+def exportar_matriz(matriz, formato="PNG", size=300):
+    """Codifica a matriz de módulos no formato pedido, sem reamostragem.
+
+    SVG e PDF são vetoriais e PNG sai em 1 bit por pixel (``png_matriz``);
+    os demais formatos (JPEG, BMP, GIF...) são gravados pelo Pillow a partir
+    da imagem 1-bit.
+    """
+    formato = formato.upper()
+    if formato == "SVG":
+        return svg_matriz(matriz, size)
+    if formato == "PDF":
+        return pdf_matriz(matriz, size)
+    if formato == "PNG":
+        return png_matriz(matriz, size)
+    imagem = renderizar_matriz(matriz, size)
+    if formato == "JPEG":
+        imagem = imagem.convert("L")
+    buffer = io.BytesIO()
+    imagem.save(buffer, format=formato)
+    return buffer.getvalue()
+
+
+def gerar_qrcode_pillow(payload, size=300):
+    """Gera um QR code usando Pillow, com módulos de tamanho inteiro e sem reamostragem"""
+    return renderizar_matriz(gerar_matriz(payload), size)
+
+
+def gerar_qrcode_svg(payload, size=300):
+    """Gera um QR code vetorial (SVG) e retorna os bytes do arquivo"""
+    return svg_matriz(gerar_matriz(payload), size)
+
+
+def gerar_qrcode_bytes(payload, formato="PNG", size=300, politica=None):
+    """Gera o QR code já codificado no formato pedido (PNG, SVG, PDF ou outro do Pillow)"""
+    return exportar_matriz(gerar_matriz(payload, politica), formato, size)
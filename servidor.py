@@ -0,0 +1,241 @@
+"""Microsserviço HTTP local para geração de payloads e QR codes Pix.
+
+Servidor HTTP/1.1 mínimo sobre asyncio (só biblioteca padrão), com conexões
+keep-alive. A renderização de QR codes e os lotes rodam em um pool de
+processos, então o event loop nunca fica bloqueado por trabalho de CPU.
+
+Endpoints:
+
+- ``POST /payload``: corpo JSON com os campos de ``GeradorPix.gerar_payload``;
+  responde ``{"payload": ...}``.
+- ``GET /qrcode.png?chave_pix=...&valor=...&size=300`` (ou ``POST`` com JSON):
+  responde a imagem PNG.
+- ``POST /batch``: corpo JSON com uma lista de cobranças; responde
+  ``{"resultados": [...]}`` com ``payload`` ou ``erro`` por item.
+
+Com ``--cache-disco`` os QR codes ficam também em um cache SQLite
+compartilhado entre os processos e entre reinícios do servidor.
+
+Uso: python servidor.py [--host 127.0.0.1] [--porta 8080] [-j PROCESSOS] [--cache-disco ARQUIVO]
+"""
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+from cli import normalizar, processar_bloco
+from lote import obter_template
+
+MAX_CORPO = 16 * 1024 * 1024
+MAX_LOTE = 100000
+TAMANHO_QR_MAX = 2000
+
+MENSAGENS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+             411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ErroHTTP(Exception):
+    """Erro que vira uma resposta HTTP com o status e a mensagem indicados"""
+
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+def _gerar_payload(argumentos):
+    chave_pix, valor, txid, nome_merchant, cidade_merchant = argumentos
+    return obter_template(chave_pix, nome_merchant, cidade_merchant).render(valor, txid)
+
+
+def configurar_cache(caminho):
+    """Liga o cache em disco ao cache de QR codes do processo; inicializador do pool"""
+    from cache_disco import abrir
+    from cache_qr import cache_padrao
+    cache_padrao.disco = abrir(caminho)
+
+
+def processar_lote(corpo):
+    """Lê, valida e gera um lote de ``/batch``; executado nos processos do pool.
+
+    O JSON de entrada e o de saída também são tratados aqui, fora do event
+    loop. Retorna ``(status, corpo da resposta)``, já que ``ErroHTTP`` não
+    volta do pool.
+    """
+    try:
+        cobrancas = ServidorPix._json(corpo)
+        if not isinstance(cobrancas, list):
+            raise ErroHTTP(400, "o corpo deve ser uma lista de cobranças")
+        if len(cobrancas) > MAX_LOTE:
+            raise ErroHTTP(413, f"no máximo {MAX_LOTE} cobranças por lote")
+    except ErroHTTP as e:
+        return e.status, ServidorPix._resposta_json({"erro": str(e)})
+    bloco = []
+    for indice, cobranca in enumerate(cobrancas):
+        try:
+            bloco.append((indice, normalizar(cobranca), None))
+        except ValueError as e:
+            bloco.append((indice, None, str(e)))
+    registros = [registro for registro, _ in processar_bloco(bloco)]
+    return 200, ServidorPix._resposta_json({"resultados": registros})
+
+
+def renderizar_png(payload, size):
+    """Renderiza o QR code em PNG; executado nos processos do pool"""
+    from cache_qr import cache_padrao
+    return cache_padrao.imagem(payload, size, "PNG")
+
+
+class ServidorPix:
+    """Atende as requisições HTTP e despacha o trabalho pesado para o executor"""
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.rotas = {
+            "/payload": self.rota_payload,
+            "/qrcode.png": self.rota_qrcode,
+            "/batch": self.rota_batch,
+        }
+
+    async def rota_payload(self, metodo, consulta, corpo):
+        if metodo != "POST":
+            raise ErroHTTP(405, "use POST")
+        payload = _gerar_payload(normalizar(self._json(corpo)))
+        return 200, "application/json", self._resposta_json({"payload": payload})
+
+    async def rota_qrcode(self, metodo, consulta, corpo):
+        if metodo == "GET":
+            dados = consulta
+        elif metodo == "POST":
+            dados = self._json(corpo)
+        else:
+            raise ErroHTTP(405, "use GET ou POST")
+        if not isinstance(dados, dict):
+            raise ErroHTTP(400, "o corpo deve ser um objeto JSON")
+        try:
+            size = int(dados.get("size", 300))
+        except (TypeError, ValueError):
+            raise ErroHTTP(400, "size deve ser um número inteiro")
+        if not 1 <= size <= TAMANHO_QR_MAX:
+            raise ErroHTTP(400, f"size deve estar entre 1 e {TAMANHO_QR_MAX}")
+        payload = _gerar_payload(normalizar(dados))
+        loop = asyncio.get_running_loop()
+        png = await loop.run_in_executor(self.executor, renderizar_png, payload, size)
+        return 200, "image/png", png
+
+    async def rota_batch(self, metodo, consulta, corpo):
+        if metodo != "POST":
+            raise ErroHTTP(405, "use POST")
+        loop = asyncio.get_running_loop()
+        status, resposta = await loop.run_in_executor(self.executor, processar_lote, corpo)
+        return status, "application/json", resposta
+
+    @staticmethod
+    def _json(corpo):
+        try:
+            return json.loads(corpo or b"null")
+        except ValueError as e:
+            raise ErroHTTP(400, f"JSON inválido: {e}")
+
+    @staticmethod
+    def _resposta_json(dados):
+        return json.dumps(dados, ensure_ascii=False).encode("utf-8")
+
+    async def atender(self, reader, writer):
+        """Atende uma conexão, processando requisições até o cliente encerrar"""
+        try:
+            while True:
+                try:
+                    cabecalho = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                manter, status, tipo, corpo = await self.processar(cabecalho, reader)
+                self._escrever(writer, status, tipo, corpo, manter)
+                await writer.drain()
+                if not manter:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def processar(self, cabecalho, reader):
+        """Interpreta uma requisição e retorna (keep-alive, status, content-type, corpo)"""
+        linhas = cabecalho.decode("latin-1").split("\r\n")
+        try:
+            metodo, alvo, versao = linhas[0].split(" ", 2)
+        except ValueError:
+            return False, 400, "application/json", self._resposta_json({"erro": "requisição inválida"})
+        cabecalhos = {}
+        for linha in linhas[1:]:
+            nome, _, valor = linha.partition(":")
+            if nome:
+                cabecalhos[nome.strip().lower()] = valor.strip()
+
+        conexao = cabecalhos.get("connection", "").lower()
+        manter = conexao != "close" if versao == "HTTP/1.1" else conexao == "keep-alive"
+
+        if "transfer-encoding" in cabecalhos:
+            # Sem suporte a chunked, o corpo não lido seria interpretado como a próxima requisição
+            return False, 411, "application/json", self._resposta_json(
+                {"erro": "Transfer-Encoding não suportado; envie o corpo com Content-Length"})
+        tamanho = cabecalhos.get("content-length", "0")
+        if not (tamanho.isascii() and tamanho.isdigit()):
+            return False, 400, "application/json", self._resposta_json({"erro": "Content-Length inválido"})
+        tamanho = int(tamanho)
+        if tamanho > MAX_CORPO:
+            return False, 413, "application/json", self._resposta_json({"erro": "corpo muito grande"})
+        corpo = await reader.readexactly(tamanho) if tamanho else b""
+
+        url = urlsplit(alvo)
+        rota = self.rotas.get(url.path)
+        try:
+            if rota is None:
+                raise ErroHTTP(404, f"rota desconhecida: {url.path}")
+            status, tipo, resposta = await rota(metodo.upper(), dict(parse_qsl(url.query)), corpo)
+        except ErroHTTP as e:
+            status, tipo, resposta = e.status, "application/json", self._resposta_json({"erro": str(e)})
+        except ValueError as e:
+            status, tipo, resposta = 400, "application/json", self._resposta_json({"erro": str(e)})
+        except Exception as e:
+            status, tipo, resposta = 500, "application/json", self._resposta_json({"erro": str(e)})
+        return manter, status, tipo, resposta
+
+    @staticmethod
+    def _escrever(writer, status, tipo, corpo, manter):
+        cabecalho = (f"HTTP/1.1 {status} {MENSAGENS.get(status, '')}\r\n"
+                     f"Content-Type: {tipo}\r\n"
+                     f"Content-Length: {len(corpo)}\r\n"
+                     f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n")
+        writer.write(cabecalho.encode("latin-1") + corpo)
+
+
+async def servir(host="127.0.0.1", porta=8080, processos=None, cache_disco=None):
+    """Inicia o servidor e atende até ser interrompido"""
+    inicializar = {"initializer": configurar_cache, "initargs": (cache_disco,)} if cache_disco else {}
+    with ProcessPoolExecutor(max_workers=processos or os.cpu_count() or 1, **inicializar) as executor:
+        servidor = ServidorPix(executor)
+        async with await asyncio.start_server(servidor.atender, host, porta) as tcp:
+            enderecos = ", ".join(str(s.getsockname()) for s in tcp.sockets)
+            print(f"Servidor Pix ouvindo em {enderecos}")
+            await tcp.serve_forever()
+
+
+def main(argv=None):
+    """Ponto de entrada do servidor"""
+    parser = argparse.ArgumentParser(description="Microsserviço HTTP de geração de payloads e QR codes Pix.")
+    parser.add_argument("--host", default="127.0.0.1", help="endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8080, help="porta de escuta (padrão: 8080)")
+    parser.add_argument("-j", "--processos", type=int, default=0,
+                        help="processos para renderizar QR codes (0 usa todos os núcleos)")
+    parser.add_argument("--cache-disco", help="arquivo SQLite para guardar os QR codes entre execuções")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.porta, args.processos or None, args.cache_disco))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
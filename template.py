@@ -0,0 +1,156 @@
+"""Campos e templates pré-compilados de payload Pix."""
+from binascii import crc_hqx
+from collections import namedtuple
+from functools import lru_cache
+
+from crc16 import CRC_INICIAL, crc16_hex
+
+MAX_CAMPO = 99  # tamanho máximo do valor de um campo TLV (dois dígitos)
+# Tamanhos TLV já formatados com dois dígitos, evitando format() por campo
+_TAMANHOS = [f"{i:02d}" for i in range(MAX_CAMPO + 1)]
+
+MAX_URL = 77  # tamanho máximo da URL de location (campo 26/25)
+MAX_VALOR = 13  # tamanho máximo do campo 54 (Transaction Amount)
+
+
+def campo_tlv(id_campo, valor):
+    """Campo TLV com ``str(valor)``; vazio se ``valor`` for None, como o campo ausente do payload.
+
+    Levanta ``ValueError`` se o valor passar de ``MAX_CAMPO`` caracteres.
+    """
+    if valor is None:
+        return ""
+    valor = str(valor)
+    if len(valor) > MAX_CAMPO:
+        raise ValueError(f"campo {id_campo} com {len(valor)} caracteres; o máximo é {MAX_CAMPO}")
+    return f"{id_campo}{_TAMANHOS[len(valor)]}{valor}"
+
+
+def formatar_valor(valor):
+    """Valor do campo 54 com duas casas, ou None se não houver campo 54 (sem valor, zero ou negativo).
+
+    Levanta ``ValueError`` se o valor não for finito ou não couber nos
+    ``MAX_VALOR`` caracteres do campo.
+    """
+    if valor is None:
+        return None
+    texto = f"{valor:.2f}"
+    if texto[-3:-2] != ".":
+        raise ValueError(f"valor inválido: {valor!r}")
+    if not valor > 0:
+        return None
+    if len(texto) > MAX_VALOR:
+        raise ValueError(f"valor maior que os {MAX_VALOR} caracteres do campo 54: {valor!r}")
+    return texto
+
+
+@lru_cache(maxsize=4096)
+def _campo_valor(valor):
+    """Campo 54 já formatado, guardado em cache para ``PayloadTemplate``"""
+    return campo_tlv("54", formatar_valor(valor))
+
+
+def _conta(subcampo, valor):
+    """Campo 26 (Merchant Account Information) com o GUI do Pix e a chave (01) ou a URL (25)"""
+    return campo_tlv("26", "0014BR.GOV.BCB.PIX" + campo_tlv(subcampo, valor))
+
+
+def _adicional(txid):
+    """Campo 62 (Additional Data Field) com o txid no subcampo 05"""
+    return campo_tlv("62", campo_tlv("05", txid))
+
+
+class CamposPayload(namedtuple("CamposPayload", ("formato", "iniciacao", "conta", "categoria", "moeda", "valor",
+                                                 "pais", "nome", "cidade", "adicional"))):
+    """Campos TLV já formatados de um payload Pix, em uma tupla imutável.
+
+    Cada chamada de ``montar`` cria a sua própria tupla, sem estado
+    compartilhado, então a geração pode rodar em várias threads ao mesmo
+    tempo. Campos ausentes ficam como string vazia.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _campos(cls, iniciacao, conta, valor, nome_merchant, cidade_merchant, txid):
+        return cls("000201", iniciacao, conta, "52040000", "5303986", campo_tlv("54", formatar_valor(valor)),
+                   "5802BR", campo_tlv("59", nome_merchant), campo_tlv("60", cidade_merchant), _adicional(txid))
+
+    @classmethod
+    def montar(cls, chave_pix, valor=None, txid="***", nome_merchant="N", cidade_merchant="C"):
+        """Formata os campos com as mesmas regras de ``GeradorPix.gerar_payload``"""
+        return cls._campos("", _conta("01", chave_pix), valor, nome_merchant, cidade_merchant, txid)
+
+    @classmethod
+    def montar_dinamico(cls, url, valor=None, nome_merchant="N", cidade_merchant="C", unico=True):
+        """Formata os campos de um Pix dinâmico, com a URL de location do PSP no campo 26/25.
+
+        O esquema ``https://`` é retirado da URL, como pede o BR Code; o
+        txid fica em "***" porque a cobrança é identificada pela location.
+        Com ``unico`` o campo 01 vale 12 (QR code de uso único).
+        """
+        if url.startswith("https://"):
+            url = url[8:]
+        if not url or len(url) > MAX_URL:
+            raise ValueError(f"a URL de location deve ter de 1 a {MAX_URL} caracteres sem o https://")
+        return cls._campos("010212" if unico else "", _conta("25", url), valor, nome_merchant, cidade_merchant,
+                           "***")
+
+    def sem_crc(self):
+        """Payload até o cabeçalho do CRC ("6304"), pronto para o cálculo do CRC16"""
+        return "".join(self) + "6304"
+
+    def payload(self):
+        """Payload completo, com o CRC16"""
+        sem_crc = self.sem_crc()
+        return sem_crc + crc16_hex(sem_crc)
+
+
+class PayloadTemplate:
+    """Payload Pix pré-compilado para uma chave, nome e cidade fixos.
+
+    Os campos estáticos (00, 26, 52, 53 e 58, 59, 60) são montados uma única
+    vez e o CRC do prefixo fica guardado, de modo que ``render`` só precisa
+    formatar o valor (54) e o txid (62/05) e continuar o CRC a partir dali.
+    A saída é idêntica à de ``GeradorPix.gerar_payload`` com os mesmos
+    argumentos.
+    """
+
+    __slots__ = ('chave_pix', 'nome_merchant', 'cidade_merchant',
+                 '_prefixo', '_prefixo_bytes', '_crc_prefixo', '_meio')
+
+    def __init__(self, chave_pix, nome_merchant="N", cidade_merchant="C"):
+        self.chave_pix = chave_pix
+        self.nome_merchant = nome_merchant
+        self.cidade_merchant = cidade_merchant
+
+        # Os campos fixos saem de CamposPayload.montar, com as mesmas regras de formatação
+        campos = CamposPayload.montar(chave_pix, None, "***", nome_merchant, cidade_merchant)
+        prefixo = campos.formato + campos.iniciacao + campos.conta + campos.categoria + campos.moeda
+        meio = campos.pais + campos.nome + campos.cidade
+
+        self._prefixo = prefixo
+        self._prefixo_bytes = prefixo.encode('ascii')
+        self._crc_prefixo = crc_hqx(self._prefixo_bytes, CRC_INICIAL)
+        self._meio = meio
+        meio.encode('ascii')  # falha já na compilação se houver caracteres não ASCII
+
+    def _sufixo(self, valor, txid):
+        """Monta a parte variável do payload, do campo 54 até o "6304" """
+        return _campo_valor(valor) + self._meio + _adicional(txid) + "6304"
+
+    def render(self, valor=None, txid="***"):
+        """Gera o payload completo (str) para o valor e txid informados"""
+        sufixo = self._sufixo(valor, txid)
+        crc = crc_hqx(sufixo.encode('ascii'), self._crc_prefixo)
+        return self._prefixo + sufixo + "%04X" % crc
+
+    def render_bytes(self, valor=None, txid="***"):
+        """Gera o payload completo como bytes ASCII"""
+        sufixo = self._sufixo(valor, txid).encode('ascii')
+        crc = crc_hqx(sufixo, self._crc_prefixo)
+        return b"%s%s%04X" % (self._prefixo_bytes, sufixo, crc)
+
+    def __repr__(self):
+        return (f"PayloadTemplate({self.chave_pix!r}, {self.nome_merchant!r}, "
+                f"{self.cidade_merchant!r})")
@@ -0,0 +1,240 @@
+"""Validação de chaves Pix, independente da interface gráfica.
+
+Confere CPF e CNPJ pelos dígitos verificadores (inclusive o CNPJ
+alfanumérico), telefone no formato E.164, chave aleatória (EVP) como UUID e
+e-mail pelo formato aceito no DICT. ``validar_lote`` valida milhões de chaves
+de uma vez com NumPy e devolve um código de erro por linha.
+"""
+import re
+
+OK = 0
+VAZIA = 1
+FORMATO_INVALIDO = 2
+DIGITO_VERIFICADOR = 3
+DIGITOS_REPETIDOS = 4
+TIPO_DESCONHECIDO = 5
+
+MENSAGENS_ERRO = {
+    OK: "chave válida",
+    VAZIA: "chave vazia",
+    FORMATO_INVALIDO: "formato inválido para o tipo",
+    DIGITO_VERIFICADOR: "dígito verificador incorreto",
+    DIGITOS_REPETIDOS: "todos os dígitos iguais",
+    TIPO_DESCONHECIDO: "tipo de chave desconhecido",
+}
+
+TIPOS = ("email", "cpf", "cnpj", "telefone", "evp")
+
+# Nomes usados no seletor da interface gráfica
+TIPOS_INTERFACE = {"E-mail": "email", "CPF": "cpf", "CNPJ": "cnpj", "Telefone": "telefone",
+                   "Chave aleatória": "evp"}
+
+_EMAIL = re.compile(r"[a-z0-9.!#$&'*+/=?^_`{|}~-]+@[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+                    r"(?:\.[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?)*", re.IGNORECASE | re.ASCII)
+_TELEFONE = re.compile(r"\+[1-9][0-9]{1,14}")
+_EVP = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE | re.ASCII)
+_CNPJ = re.compile(r"[0-9A-Z]{12}[0-9]{2}")
+
+MAX_EMAIL = 77
+
+_PESOS_CPF_1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CPF_2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def _digito(valores, pesos):
+    """Dígito verificador módulo 11 usado por CPF e CNPJ"""
+    resto = sum(v * p for v, p in zip(valores, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def validar_cpf(cpf):
+    """Retorna o código de erro da validação de um CPF (11 dígitos, sem pontuação)"""
+    if len(cpf) != 11 or not (cpf.isascii() and cpf.isdigit()):
+        return FORMATO_INVALIDO
+    if cpf == cpf[0] * 11:
+        return DIGITOS_REPETIDOS
+    numeros = [ord(c) - 48 for c in cpf]
+    if numeros[9] != _digito(numeros, _PESOS_CPF_1) or numeros[10] != _digito(numeros, _PESOS_CPF_2):
+        return DIGITO_VERIFICADOR
+    return OK
+
+
+def validar_cnpj(cnpj):
+    """Retorna o código de erro da validação de um CNPJ (14 caracteres, sem pontuação).
+
+    Aceita o CNPJ alfanumérico: letras maiúsculas nas 12 primeiras posições
+    valem o código ASCII menos 48, como define a Receita Federal.
+    """
+    if len(cnpj) != 14 or not _CNPJ.fullmatch(cnpj):
+        return FORMATO_INVALIDO
+    if cnpj == cnpj[0] * 14:
+        return DIGITOS_REPETIDOS
+    valores = [ord(c) - 48 for c in cnpj]
+    if valores[12] != _digito(valores, _PESOS_CNPJ_1) or valores[13] != _digito(valores, _PESOS_CNPJ_2):
+        return DIGITO_VERIFICADOR
+    return OK
+
+
+def detectar_tipo(chave):
+    """Deduz o tipo de uma chave pelo formato; retorna None se não for possível"""
+    if "@" in chave:
+        return "email"
+    if chave.startswith("+"):
+        return "telefone"
+    if len(chave) == 36 and chave[8:9] == "-":
+        return "evp"
+    if len(chave) == 11:
+        return "cpf"
+    if len(chave) == 14:
+        return "cnpj"
+    return None
+
+
+def validar_chave(chave, tipo=None):
+    """Valida uma chave Pix e retorna um código de erro (``OK`` se válida).
+
+    ``tipo`` é um de ``TIPOS`` ou um nome da interface ("CPF", "E-mail"...);
+    se omitido, é deduzido com ``detectar_tipo``.
+    """
+    chave = chave.strip()
+    if not chave:
+        return VAZIA
+    tipo = TIPOS_INTERFACE.get(tipo, tipo) if tipo else detectar_tipo(chave)
+    if tipo == "cpf":
+        return validar_cpf(chave)
+    if tipo == "cnpj":
+        return validar_cnpj(chave)
+    if tipo == "telefone":
+        return OK if _TELEFONE.fullmatch(chave) else FORMATO_INVALIDO
+    if tipo == "evp":
+        return OK if _EVP.fullmatch(chave) else FORMATO_INVALIDO
+    if tipo == "email":
+        return OK if len(chave) <= MAX_EMAIL and _EMAIL.fullmatch(chave) else FORMATO_INVALIDO
+    return TIPO_DESCONHECIDO
+
+
+def _importar_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{e}. A validação em lote precisa do NumPy: pip install numpy") from e
+    return numpy
+
+
+def _verificador_vetorizado(np, valores, pesos1, pesos2):
+    """Confere os dois dígitos verificadores módulo 11 de cada linha de ``valores``"""
+    k = len(pesos1)
+    r1 = (valores[:, :k] @ np.array(pesos1)) % 11
+    r2 = (valores[:, :k + 1] @ np.array(pesos2)) % 11
+    return (valores[:, k] == np.where(r1 < 2, 0, 11 - r1)) & (valores[:, k + 1] == np.where(r2 < 2, 0, 11 - r2))
+
+
+def _codigo_tipo(tipo):
+    """Código de ``tipo`` para ``_validar_bloco``: -1 para detectar, ``len(TIPOS)`` se desconhecido"""
+    if not tipo:
+        return -1
+    tipo = TIPOS_INTERFACE.get(tipo, tipo)
+    return TIPOS.index(tipo) if tipo in TIPOS else len(TIPOS)
+
+
+def _validar_bloco(np, chaves, tipos):
+    """Valida um bloco de chaves; ``tipos`` é um array de códigos de tipo (ou -1 para detectar).
+
+    Cada chave vira uma linha de 36 bytes (caracteres fora do ASCII viram
+    255 e nunca casam com nada); cada tipo é validado só sobre as suas
+    linhas.
+    """
+    n = len(chaves)
+    largura = 36
+    texto = np.array(chaves, dtype=f"U{largura}")  # cada linha truncada em 36 caracteres
+    cp = np.minimum(texto.view(np.uint32).reshape(n, largura), 255).astype(np.uint8)
+    tamanhos = np.fromiter(map(len, chaves), dtype=np.int64, count=n)
+
+    if (tipos < 0).any():
+        tem_arroba = (cp == 64).any(axis=1)
+        for i in np.flatnonzero(tamanhos > largura):
+            tem_arroba[i] = "@" in chaves[i]
+        detectados = np.full(n, len(TIPOS), dtype=np.int64)  # len(TIPOS) = tipo desconhecido
+        detectados[tamanhos == 14] = TIPOS.index("cnpj")
+        detectados[tamanhos == 11] = TIPOS.index("cpf")
+        detectados[(tamanhos == 36) & (cp[:, 8] == 45)] = TIPOS.index("evp")
+        detectados[cp[:, 0] == 43] = TIPOS.index("telefone")
+        detectados[tem_arroba] = TIPOS.index("email")
+        tipos = np.where(tipos < 0, detectados, tipos)
+
+    erros = np.full(n, TIPO_DESCONHECIDO, dtype=np.uint8)
+
+    # CPF e CNPJ (o CNPJ pode ter letras maiúsculas nas 12 primeiras posições)
+    for tipo, tamanho, pesos1, pesos2 in (("cpf", 11, _PESOS_CPF_1, _PESOS_CPF_2),
+                                          ("cnpj", 14, _PESOS_CNPJ_1, _PESOS_CNPJ_2)):
+        linhas = np.flatnonzero(tipos == TIPOS.index(tipo))
+        if not len(linhas):
+            continue
+        sub = cp[linhas, :tamanho]
+        digito = (sub >= 48) & (sub <= 57)
+        if tipo == "cnpj":
+            digito[:, :12] |= (sub[:, :12] >= 65) & (sub[:, :12] <= 90)
+        ok_formato = (tamanhos[linhas] == tamanho) & digito.all(axis=1)
+        repetidos = (sub == sub[:, :1]).all(axis=1)
+        dv_ok = _verificador_vetorizado(np, sub.astype(np.int64) - 48, pesos1, pesos2)
+        erros[linhas] = np.select([~ok_formato, repetidos, ~dv_ok],
+                                  [FORMATO_INVALIDO, DIGITOS_REPETIDOS, DIGITO_VERIFICADOR], OK)
+
+    # Telefone E.164: "+", dígito de 1 a 9 e até 15 dígitos no total
+    linhas = np.flatnonzero(tipos == TIPOS.index("telefone"))
+    if len(linhas):
+        sub = cp[linhas, :16]
+        tam = tamanhos[linhas]
+        fora = np.arange(16)[None, :] >= tam[:, None]  # posições depois do fim da chave
+        fora[:, 0] = True
+        ok = ((tam >= 3) & (tam <= 16) & (sub[:, 0] == 43) & (sub[:, 1] != 48)
+              & (((sub >= 48) & (sub <= 57)) | fora).all(axis=1))
+        erros[linhas] = np.where(ok, OK, FORMATO_INVALIDO)
+
+    # Chave aleatória (EVP): UUID com hífens nas posições 8, 13, 18 e 23
+    linhas = np.flatnonzero(tipos == TIPOS.index("evp"))
+    if len(linhas):
+        sub = cp[linhas]
+        hexa = (((sub >= 48) & (sub <= 57)) | ((sub >= 97) & (sub <= 102)) | ((sub >= 65) & (sub <= 70)))
+        hifens = np.zeros(largura, dtype=bool)
+        hifens[[8, 13, 18, 23]] = True
+        ok = (tamanhos[linhas] == 36) & np.where(hifens, sub == 45, hexa).all(axis=1)
+        erros[linhas] = np.where(ok, OK, FORMATO_INVALIDO)
+
+    # E-mail: expressão regular por linha (não há como vetorizar)
+    linhas = np.flatnonzero(tipos == TIPOS.index("email"))
+    if len(linhas):
+        casa = _EMAIL.fullmatch
+        erros[linhas] = [OK if len(c) <= MAX_EMAIL and casa(c) else FORMATO_INVALIDO
+                         for c in map(chaves.__getitem__, linhas.tolist())]
+
+    erros[tamanhos == 0] = VAZIA
+    return erros
+
+
+def validar_lote(chaves, tipo=None, tamanho_bloco=65536):
+    """Valida muitas chaves de uma vez com NumPy e retorna um array uint8 de códigos de erro.
+
+    ``tipo`` pode ser um único tipo para todas as chaves, uma sequência com
+    o tipo de cada chave ou None para deduzir o tipo de cada uma. CPF, CNPJ,
+    telefone e EVP são validados de forma vetorizada; e-mails passam pela
+    expressão regular linha a linha. O resultado é o mesmo de
+    ``validar_chave`` para cada chave: os espaços nas pontas são aparados e
+    um tipo desconhecido dá ``TIPO_DESCONHECIDO``.
+    """
+    np = _importar_numpy()
+    chaves = list(map(str.strip, chaves))
+    n = len(chaves)
+    if tipo is None or isinstance(tipo, str):
+        tipos = np.full(n, _codigo_tipo(tipo), dtype=np.int64)
+    else:
+        indices = {t: _codigo_tipo(t) for t in set(tipo)}
+        tipos = np.fromiter(map(indices.__getitem__, tipo), dtype=np.int64, count=n)
+
+    erros = np.empty(n, dtype=np.uint8)
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+        erros[inicio:fim] = _validar_bloco(np, chaves[inicio:fim], tipos[inicio:fim])
+    return erros